@@ -62,6 +62,12 @@ try:
     ConVar('sp_logging_areas').set_int(
         int(_CoreSettingsInstance['LOG_SETTINGS']['areas']))
 
+    # Import the _SPLogger
+    from loggers import _SPLogger
+
+    # Use the new logging values right away
+    _SPLogger.refresh()
+
 # Was an exception raised?
 except (ValueError, ConfigObjError):
 
@@ -74,6 +80,9 @@ except (ValueError, ConfigObjError):
     # Import the _SPLogger
     from loggers import _SPLogger
 
+    # Use the new logging values right away
+    _SPLogger.refresh()
+
     # Log a message about the value
     _SPLogger.log_message(
         '[Source.Python] Plugin did not load properly ' +
@@ -10,6 +10,7 @@ from configobj import ConfigObj
 # Source.Python Imports
 import dump_c
 from engine_c import EngineServer
+from loggers import _dump_memory_logs
 from _core import _CoreLogger
 from paths import SP_DATA_PATH
 #   Plugins
@@ -124,9 +125,55 @@ class _SPSubCommandManager(SubCommandManager):
             float(args[0]),
             EngineServer.server_command, ' '.join(args[1:]) + '\n')
 
-    def dump_data(self, dump_type):
+    def dump_data(self, dump_type, *args):
         '''Dumps data to logs.'''
 
+        # Get the arguments the dump type uses
+        usage = ['memory', '[count]'] if dump_type == 'memory' else [
+            '<dump_type>']
+
+        # Were too many arguments given for the dump type?
+        if len(args) > len(usage) - 1:
+
+            # Print a message about the invalid arguments
+            self.logger.log_message(
+                self.prefix + self.translations[
+                    'Invalid Arguments'].get_string(
+                    command=self.command, subcommand='dump') +
+                ' '.join(usage))
+
+            # No need to go further
+            return
+
+        # Is the memory log supposed to be dumped?
+        if dump_type == 'memory':
+
+            # Get the count, if one was given
+            count = args[0] if args else None
+
+            # Was a count given?
+            if count is not None:
+
+                # Is the count not a positive number?
+                if not count.isdigit() or not int(count):
+
+                    # Print a message about the invalid count
+                    self.logger.log_message(
+                        'Invalid count "{0}". The count must be a '.format(
+                            count) + 'positive integer.')
+
+                    # No need to go further
+                    return
+
+                # Get the count as an integer
+                count = int(count)
+
+            # Dump the last count messages of all memory logs
+            _dump_memory_logs(count)
+
+            # No need to go further
+            return
+
         # Does the given dump type exist as a function?
         if not hasattr(dump_c, 'dump_' + dump_type):
 
@@ -146,15 +193,19 @@ class _SPSubCommandManager(SubCommandManager):
                     
                 # Print the current dump function
                 self.logger.log_message('\t{0}'.format(dump.lstrip('dump_')))
-                
+
+            # Print the memory log dump
+            self.logger.log_message('\tmemory')
+
             # No need to go further
             return
             
-        # Call the function
-        getattr(dump_c, 'dump_' + dump_type)()
+        # Call the function, writing its output to the log files at once
+        with self.logger.root.buffer_dumps():
+            getattr(dump_c, 'dump_' + dump_type)()
 
     # Set the methods arguments
-    dump_data.args = ['<dump_type>']
+    dump_data.args = ['<dump_type>', '[count]']
 
     @staticmethod
     def print_version():
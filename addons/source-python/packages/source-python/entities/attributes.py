@@ -3,11 +3,19 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Python Imports
+#   Hashlib
+from hashlib import md5
+#   Marshal
+import marshal
+#   OS
+import os
+#   Sys
+import sys
+
 # Site-Package Imports
 #   ConfigObj
 from configobj import ConfigObj
-#   Sys
-import sys
 
 # Source.Python Imports
 from core import GAME_NAME
@@ -28,10 +36,184 @@ __all__ = []
 # Get the sp.entities.attributes logger
 EntitiesAttributesLogger = EntitiesLogger.attributes
 
+# Get the path to the compiled attribute data of the current game
+_compiled_file = SP_DATA_PATH.joinpath(
+    'attributes_{0}.cache'.format(GAME_NAME))
+
+# Store the version of the compiled data's format.  The Python version
+# is also checked, since the marshal format can change between versions.
+_compiled_version = (1, sys.hexversion, marshal.version)
+
 
 # =============================================================================
 # >> CLASSES
 # =============================================================================
+class _AttributeData(dict):
+    '''Dictionary that stores the parsed ini data of each attribute type
+        for the current game.  All types are stored together in one
+        compiled file, which is loaded on startup and used as long as
+        the modification time or hash of each of the type's ini files
+        is unchanged, so the ini files are only parsed when they change.'''
+
+    def __init__(self, *args, **kwargs):
+        '''Loads the compiled data'''
+
+        # Call the super class' __init__
+        super(_AttributeData, self).__init__(*args, **kwargs)
+
+        # Load the compiled data
+        self._load()
+
+    def get_type_data(self, attribute_type, unrepr):
+        '''Returns the ini data of each entity for the given type'''
+
+        # Are the type's compiled data out of date?
+        if not self._is_current(attribute_type, unrepr):
+
+            # Parse the type's ini files and store the compiled data
+            self._compile(attribute_type, unrepr)
+
+        # Return the type's data
+        return self[attribute_type]['entities']
+
+    def _is_current(self, attribute_type, unrepr):
+        '''Returns whether the type's compiled data match its ini files'''
+
+        # Has the type not been compiled with the given unrepr value?
+        if (attribute_type not in self or
+                self[attribute_type]['unrepr'] != unrepr):
+            return False
+
+        # Get the stored state of the type's ini files
+        sources = self[attribute_type]['sources']
+
+        # Get the type's current ini files
+        inifiles = _get_ini_files(attribute_type)
+
+        # Was an ini file added or removed?
+        if set(inifiles) != set(sources):
+            return False
+
+        # Store whether any file's state needs to be saved
+        refreshed = False
+
+        # Loop through all ini files
+        for entity, inifile in inifiles.items():
+
+            # Get the stored state of the file
+            mtime, size, digest = sources[entity]
+
+            # Get the file's current modification time and size
+            stat = inifile.stat()
+
+            # Are the modification time and size unchanged?
+            if stat.st_mtime == mtime and stat.st_size == size:
+                continue
+
+            # Did the file's contents change?
+            if md5(inifile.bytes()).digest() != digest:
+                return False
+
+            # Store the file's new modification time
+            sources[entity] = (stat.st_mtime, stat.st_size, digest)
+            refreshed = True
+
+        # Were any files' modification times updated?
+        if refreshed:
+
+            # Store the new modification times, so the
+            # files are not hashed again on the next startup
+            self._save()
+
+        # Return True, since none of the files changed
+        return True
+
+    def _compile(self, attribute_type, unrepr):
+        '''Parses the type's ini files and stores the compiled data'''
+
+        # Log the compile message
+        EntitiesAttributesLogger.log_debug(
+            'Compiling "{0}" attribute data'.format(attribute_type))
+
+        # Create the type's data
+        sources = dict()
+        entities = dict()
+
+        # Loop through all of the type's ini files
+        for entity, inifile in _get_ini_files(attribute_type).items():
+
+            # Store the file's state
+            stat = inifile.stat()
+            sources[entity] = (
+                stat.st_mtime, stat.st_size, md5(inifile.bytes()).digest())
+
+            # Store the file's contents
+            entities[entity] = ConfigObj(inifile, unrepr=unrepr).dict()
+
+        # Store the type's data
+        self[attribute_type] = {
+            'unrepr': unrepr, 'sources': sources, 'entities': entities}
+
+        # Store the compiled data
+        self._save()
+
+    def _load(self):
+        '''Loads the compiled data from the compiled file'''
+
+        # Does the compiled file not exist?
+        if not _compiled_file.isfile():
+            return
+
+        # Use try/except in case the file can not be read
+        try:
+
+            # Get the file's contents
+            version, types = marshal.loads(_compiled_file.bytes())
+
+        # Was the file unable to be read?
+        except (OSError, EOFError, ValueError, TypeError):
+
+            # Parse the ini files again
+            return
+
+        # Was the file compiled with a different version?
+        if version != _compiled_version:
+            return
+
+        # Store the compiled data
+        self.update(types)
+
+    def _save(self):
+        '''Writes the compiled data to the compiled file'''
+
+        # Get a temporary path, so that the file is never partially written
+        temp_file = _compiled_file + '.tmp'
+
+        # Use try/except in case the file can not be written
+        try:
+
+            # Write the compiled data to the temporary file
+            with open(temp_file, 'wb') as open_file:
+                marshal.dump((_compiled_version, dict(self)), open_file)
+
+            # Replace the compiled file
+            os.replace(temp_file, _compiled_file)
+
+        # Was the file unable to be written?
+        except (OSError, ValueError):
+
+            # Get the exception
+            exctype, value, trace_back = sys.exc_info()
+
+            # Log the error as a warning
+            EntitiesAttributesLogger.log_warning(
+                'Unable to store the compiled attribute data ' +
+                'due to the following:\n\t{0}'.format(value))
+
+# Get the _AttributeData instance
+AttributeData = _AttributeData()
+
+
 class EntityAttributes(dict):
     '''Base Attribute class used to interact with
         entity's based off of ini data files.'''
@@ -43,17 +225,79 @@ class EntityAttributes(dict):
         instance    -   used to know which class to use to create the objects
     '''
 
+    # Store a value that changes every time any entity's data changes
+    generation = 0
+
+    def __init__(self, *args, **kwargs):
+        '''Creates the cache of merged attributes and gets the ini data'''
+
+        # Call the super class' __init__
+        super(EntityAttributes, self).__init__(*args, **kwargs)
+
+        # Store a dictionary to cache the merged attributes by entities
+        self._game_attributes = dict()
+
+        # Get the ini data of each entity
+        self._ini_data = AttributeData.get_type_data(self.type, self.unrepr)
+
     def __missing__(self, entity):
         '''Called the first time an entity is added to the dictionary'''
 
         # Get all attributes for the given entity
-        values = self[entity] = self._retrieve_attributes(entity)
+        values = self._retrieve_attributes(entity)
+
+        # Store the attributes without clearing the merged attributes,
+        # since loading an entity for the first time changes no data
+        super(EntityAttributes, self).__setitem__(entity, values)
 
         # Return the attributes and their values
         return values
 
+    def __setitem__(self, entity, values):
+        '''Clears the merged attributes when an entity's data changes'''
+
+        # Clear the merged attributes
+        self._clear_game_attributes()
+
+        # Store the entity's attributes
+        super(EntityAttributes, self).__setitem__(entity, values)
+
+    def __delitem__(self, entity):
+        '''Clears the merged attributes when an entity's data is removed'''
+
+        # Clear the merged attributes
+        self._clear_game_attributes()
+
+        # Remove the entity's attributes
+        super(EntityAttributes, self).__delitem__(entity)
+
+    def clear(self):
+        '''Removes all entities so that their data is read again'''
+
+        # Clear the merged attributes
+        self._clear_game_attributes()
+
+        # Get the ini data again, in case any of the files changed
+        self._ini_data = AttributeData.get_type_data(self.type, self.unrepr)
+
+        # Remove all entities
+        super(EntityAttributes, self).clear()
+
     def get_game_attributes(self, args):
-        '''Returns all attributes for the given entities'''
+        '''Returns all attributes for the given entities.  The returned
+            dictionary is shared between calls and must not be altered.'''
+
+        # Get the key for the given entities
+        args = frozenset(args)
+
+        # Get the merged attributes for the given entities
+        values = self._game_attributes.get(args)
+
+        # Have the attributes already been merged?
+        if values is not None:
+
+            # Return the merged attributes
+            return values
 
         # Create an empty dictionary
         values = dict()
@@ -64,26 +308,35 @@ class EntityAttributes(dict):
             # Add the entities to the dictionary
             values.update(self[arg])
 
+        # Store the merged attributes
+        self._game_attributes[args] = values
+
         # Return all attributes for the given entities
         return values
 
+    def _clear_game_attributes(self):
+        '''Clears the merged attributes and marks the data as changed'''
+
+        # Clear the merged attributes
+        self._game_attributes.clear()
+
+        # Mark the data as changed for everything built from it
+        EntityAttributes.generation += 1
+
     def _retrieve_attributes(self, entity):
         '''Retrieves all attributes for the given entity'''
 
         # Create an empty dictionary
         game_attributes = dict()
 
-        # Get the path to the entity's attributes
-        inifile = SP_DATA_PATH.joinpath(self.type, entity, GAME_NAME + '.ini')
-
-        # Does the file exist?
-        if not inifile.isfile():
+        # Does the entity have an ini file?
+        if not entity in self._ini_data:
 
             # Return the empty dictionary
             return game_attributes
 
         # Get the file's contents
-        ini = ConfigObj(inifile, unrepr=self.unrepr)
+        ini = self._ini_data[entity]
 
         # Loop through all items in the file
         for key in ini:
@@ -115,3 +368,35 @@ class EntityAttributes(dict):
 
         # Return the dictionary
         return game_attributes
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _get_ini_files(attribute_type):
+    '''Returns the current game's ini file of each entity for the type'''
+
+    # Get the type's directory
+    directory = SP_DATA_PATH.joinpath(attribute_type)
+
+    # Does the directory not exist?
+    if not directory.isdir():
+        return dict()
+
+    # Create an empty dictionary
+    inifiles = dict()
+
+    # Loop through all entity directories
+    for entity_directory in directory.dirs():
+
+        # Get the entity's ini file for the current game
+        inifile = entity_directory.joinpath(GAME_NAME + '.ini')
+
+        # Does the file exist?
+        if inifile.isfile():
+
+            # Add the file
+            inifiles[str(entity_directory.name)] = inifile
+
+    # Return the ini files
+    return inifiles
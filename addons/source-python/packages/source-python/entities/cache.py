@@ -0,0 +1,88 @@
+# ../entities/cache.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+from conversions_c import index_from_edict
+from listener_c import ClientDisconnectListenerManager
+from listener_c import OnEdictFreedListenerManager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+# Set all to an empty list
+__all__ = []
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _EntityCache(dict):
+    '''Dictionary that stores entity instances by their index.  The
+        instances of an index are removed when its edict is freed or
+        when the client using it disconnects.  Each removal also changes
+        the index's serial, so that values stored by instances
+        (like their pointer) can be checked for still being valid.'''
+
+    def __init__(self, *args, **kwargs):
+        '''Creates the dictionary of serials'''
+
+        # Call the super class' __init__
+        super(_EntityCache, self).__init__(*args, **kwargs)
+
+        # Store a dictionary for the serial of each index
+        self.serials = dict()
+
+    def get_entity(self, cls, index, *entities):
+        '''Returns the cached instance of the given class
+            for the index, creating it if it is not cached'''
+
+        # Get the instances of the index
+        instances = self.get(index)
+
+        # Get the key for the instance.  The entities are used as a
+        # frozenset, since their order does not change the instance.
+        key = (cls, frozenset(entities))
+
+        # Is the instance cached?
+        if instances is not None and key in instances:
+
+            # Return the cached instance
+            return instances[key]
+
+        # Create the instance (this raises for invalid indexes)
+        instance = cls(index, *entities)
+
+        # Store the instance
+        self.setdefault(index, dict())[key] = instance
+
+        # Return the instance
+        return instance
+
+    def remove_index(self, index):
+        '''Removes all cached instances of the given index'''
+
+        # Remove the instances
+        self.pop(index, None)
+
+        # Change the serial of the index
+        self.serials[index] = self.serials.get(index, 0) + 1
+
+# Get the _EntityCache instance
+EntityCache = _EntityCache()
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _remove_edict(edict):
+    '''Removes the cached instances of the given edict'''
+    EntityCache.remove_index(index_from_edict(edict))
+
+# Remove the cached instances when their edict is freed
+OnEdictFreedListenerManager.register_listener(_remove_edict)
+
+# Remove the cached instances when their client disconnects
+ClientDisconnectListenerManager.register_listener(_remove_edict)
@@ -0,0 +1,406 @@
+# ../entities/changes.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+from entity_c import PropHandle
+from listener_c import ClientPutInServerListenerManager
+from listener_c import OnEdictAllocatedListenerManager
+from listener_c import OnEdictFreedListenerManager
+from listener_c import TickListenerManager
+from excepthooks import ExceptHooks
+#   Entities
+from entities import EntitiesLogger
+from entities.helpers import index_from_edict
+from entities.registry import EntityRegistry
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+# Add all the global variables to __all__
+__all__ = [
+    'PropertyChanges',
+]
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Get the sp.entities.changes logger
+EntitiesChangesLogger = EntitiesLogger.changes
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _WatchedEntity(object):
+    '''Class used to store the last known state of a watched entity'''
+
+    def __init__(self, edict, handles):
+        '''Stores the edict and the current values of the properties'''
+
+        # Store the edict
+        self.edict = edict
+
+        # Store the edict's current change state
+        self.serial_number = edict.get_change_info_serial_number()
+        self.state_changed = edict.has_state_changed()
+
+        # Store the current values of the properties
+        self.values = dict(
+            (prop_name, handles[prop_name].get_value(edict))
+            for prop_name in handles)
+
+    def has_changed(self):
+        '''Returns whether the engine marked the edict as changed since the
+            last check.  The edict's change info serial number is only
+            updated on the first change of each network frame, so an edict
+            that was marked as changed during the last check is checked
+            again, as it might have changed later in that same frame.'''
+
+        # Get the edict's current change state
+        edict = self.edict
+        serial_number = edict.get_change_info_serial_number()
+        changed = (
+            self.state_changed or serial_number != self.serial_number)
+
+        # Store the current change state
+        self.serial_number = serial_number
+        self.state_changed = edict.has_state_changed()
+
+        # Return whether the edict might have changed
+        return changed
+
+
+class _WatchedClass(dict):
+    '''Dictionary that stores the callbacks of each watched
+        property and the watched entities of a classname'''
+
+    def __init__(self, classname):
+        '''Stores the classname'''
+
+        # Call the super class' __init__
+        super(_WatchedClass, self).__init__()
+
+        # Store the classname
+        self.classname = classname
+
+        # Store a PropHandle for each watched property
+        self.handles = dict()
+
+        # Store the watched entities by their index
+        self.entities = dict()
+
+    def add_property(self, prop_name):
+        '''Adds the property to the watched properties'''
+
+        # Get the property's PropHandle
+        handle = PropHandle(prop_name)
+
+        # Get the current value of the property for all watched entities.
+        # This resolves the property before it is stored, so an invalid
+        # property raises an error without changing the watched class.
+        values = dict(
+            (index, handle.get_value(entity.edict))
+            for index, entity in self.entities.items())
+
+        # Add the property
+        self[prop_name] = list()
+        self.handles[prop_name] = handle
+
+        # Store the property's values for the watched entities
+        for index, value in values.items():
+            self.entities[index].values[prop_name] = value
+
+    def remove_property(self, prop_name):
+        '''Removes the property from the watched properties'''
+
+        # Remove the property
+        del self[prop_name]
+        del self.handles[prop_name]
+
+        # Remove the property's values from the watched entities
+        for entity in self.entities.values():
+            del entity.values[prop_name]
+
+    def add_entity(self, index, edict):
+        '''Adds the entity to the watched entities'''
+        self.entities[index] = _WatchedEntity(edict, self.handles)
+
+    def check_entities(self):
+        '''Calls the callbacks for each watched property that changed'''
+
+        # Loop through all watched entities
+        for index, entity in list(self.entities.items()):
+
+            # Did the engine not mark the entity as changed?
+            if not entity.has_changed():
+                continue
+
+            # Loop through all watched properties.  A copy is used, since
+            # the callbacks can subscribe to or unsubscribe from properties.
+            for prop_name, handle in list(self.handles.items()):
+
+                # Was the property removed by one of the callbacks?
+                if not prop_name in self.handles:
+                    continue
+
+                # Get the property's old and new values
+                old_value = entity.values[prop_name]
+                new_value = handle.get_value(entity.edict)
+
+                # Did the value not change?
+                if new_value == old_value:
+                    continue
+
+                # Store the new value
+                entity.values[prop_name] = new_value
+
+                # Loop through all callbacks for the property
+                for callback in list(self[prop_name]):
+
+                    # Use try/except to continue with the other callbacks
+                    try:
+
+                        # Call the callback
+                        callback(index, prop_name, old_value, new_value)
+
+                    # Was an exception raised?
+                    except:
+
+                        # Print the exception to the console
+                        ExceptHooks.print_exception()
+
+
+class _PropertyChanges(dict):
+    '''Dictionary that stores the watched classnames.  Each tick, only the
+        entities the engine marked as changed have their properties
+        compared, and callbacks are only called for values that changed.'''
+
+    def __init__(self, *args, **kwargs):
+        '''Creates the list of entities waiting to be added'''
+
+        # Call the super class' __init__
+        super(_PropertyChanges, self).__init__(*args, **kwargs)
+
+        # Store the edicts that were allocated since the last tick.
+        # Their classname is only known once they are spawned.
+        self._pending = list()
+
+    def subscribe(self, classname, prop_name, callback):
+        '''Registers the callback to be called with the index, property
+            name, old value, and new value when the property changes
+            for any entity of the given classname'''
+
+        # Is the given callback callable?
+        if not callable(callback):
+
+            # Raise an error
+            raise TypeError('Callback must be callable')
+
+        # Get the classname's watched properties
+        watched_class = self.get(classname)
+
+        # Is the classname not watched yet?
+        if watched_class is None:
+
+            # Create the classname's watched properties
+            watched_class = _WatchedClass(classname)
+
+            # Add all of the classname's current entities
+            for edict in EntityRegistry.get_edicts(classname):
+                watched_class.add_entity(index_from_edict(edict), edict)
+
+        # Is the callback already registered for the property?
+        if callback in watched_class.get(prop_name, ()):
+
+            # Raise an error
+            raise ValueError(
+                'Callback already registered for "{0}" of "{1}"'.format(
+                    prop_name, classname))
+
+        # Is the property not watched yet?
+        if not prop_name in watched_class:
+
+            # Add the property.  This raises an error for an invalid
+            # property before the classname or listeners are stored.
+            watched_class.add_property(prop_name)
+
+        # Is this the first watched classname?
+        if not self:
+
+            # Log the tick listener registration message
+            EntitiesChangesLogger.log_info(
+                'PropertyChanges - Registering Tick Listener')
+
+            # Register the listeners
+            TickListenerManager.register_listener(self._tick)
+            OnEdictAllocatedListenerManager.register_listener(
+                self._add_pending)
+            ClientPutInServerListenerManager.register_listener(
+                self._add_pending)
+            OnEdictFreedListenerManager.register_listener(
+                self._remove_edict)
+
+        # Store the classname's watched properties
+        self[classname] = watched_class
+
+        # Add the callback
+        watched_class[prop_name].append(callback)
+
+    def unsubscribe(self, classname, prop_name, callback):
+        '''Unregisters the callback for the property of the classname'''
+
+        # Is the callback not registered?
+        if (not classname in self or not prop_name in self[classname] or
+                not callback in self[classname][prop_name]):
+
+            # Raise an error
+            raise ValueError(
+                'Callback not registered for "{0}" of "{1}"'.format(
+                    prop_name, classname))
+
+        # Remove the callback
+        self[classname][prop_name].remove(callback)
+
+        # Are there no more callbacks for the property?
+        if not self[classname][prop_name]:
+
+            # Remove the property
+            self._remove_property(classname, prop_name)
+
+    def _remove_property(self, classname, prop_name):
+        '''Removes the property and its callbacks from the classname'''
+
+        # Get the classname's watched properties
+        watched_class = self[classname]
+
+        # Remove the property
+        watched_class.remove_property(prop_name)
+
+        # Are there no more watched properties for the classname?
+        if not watched_class:
+
+            # Remove the classname
+            del self[classname]
+
+        # Are there no more watched classnames?
+        if not self:
+
+            # Log the tick listener unregistration message
+            EntitiesChangesLogger.log_info(
+                'PropertyChanges - Unregistering Tick Listener')
+
+            # Unregister the listeners
+            TickListenerManager.unregister_listener(self._tick)
+            OnEdictAllocatedListenerManager.unregister_listener(
+                self._add_pending)
+            ClientPutInServerListenerManager.unregister_listener(
+                self._add_pending)
+            OnEdictFreedListenerManager.unregister_listener(
+                self._remove_edict)
+
+            # Clear the pending edicts
+            self._pending = list()
+
+    def _tick(self):
+        '''Adds the pending edicts and calls the callbacks for changes'''
+
+        # Are there any pending edicts?
+        if self._pending:
+
+            # Add the pending edicts to their classname
+            self._add_pending_edicts()
+
+        # Loop through all watched classnames
+        for watched_class in list(self.values()):
+
+            # Check the classname's entities for changes
+            watched_class.check_entities()
+
+    def _add_pending_edicts(self):
+        '''Adds the pending edicts to the watched classnames'''
+
+        # Get the pending edicts
+        pending = self._pending
+        self._pending = list()
+
+        # Loop through all pending edicts
+        for edict in pending:
+
+            # Is the edict no longer valid?
+            if edict.is_free():
+                continue
+
+            # Get the edict's classname
+            classname = edict.get_class_name()
+
+            # Is the classname not watched?
+            if not classname in self:
+                continue
+
+            # Get the edict's index
+            index = index_from_edict(edict)
+
+            # Is the entity already watched?
+            if index in self[classname].entities:
+                continue
+
+            # Add the entity
+            self._add_entity(classname, index, edict)
+
+    def _add_entity(self, classname, index, edict):
+        '''Adds the entity to the classname.  Properties that can not be
+            resolved for the entity are removed along with their callbacks,
+            as they could not be validated when they were subscribed to.'''
+
+        # Get the classname's watched properties
+        watched_class = self[classname]
+
+        # Loop through all watched properties
+        for prop_name, handle in list(watched_class.handles.items()):
+
+            # Use try/except to find properties that can not be resolved
+            try:
+
+                # Resolve the property for the entity
+                handle.get_value(edict)
+
+            # Was the property not found?
+            except ValueError:
+
+                # Log the invalid property
+                EntitiesChangesLogger.log_warning(
+                    'PropertyChanges - Removing invalid property ' +
+                    '"{0}" of "{1}"'.format(prop_name, classname))
+
+                # Remove the property and its callbacks
+                self._remove_property(classname, prop_name)
+
+                # Was the classname removed?
+                if not classname in self:
+                    return
+
+        # Add the entity
+        watched_class.add_entity(index, edict)
+
+    def _add_pending(self, edict, *args):
+        '''Stores the allocated edict to be added on the next tick'''
+        self._pending.append(edict)
+
+    def _remove_edict(self, edict):
+        '''Removes the freed edict from the watched entities'''
+
+        # Get the edict's index
+        index = index_from_edict(edict)
+
+        # Loop through all watched classnames
+        for watched_class in self.values():
+
+            # Remove the entity from the classname
+            watched_class.entities.pop(index, None)
+
+# Get the _PropertyChanges instance
+PropertyChanges = _PropertyChanges()
@@ -0,0 +1,281 @@
+# ../entities/classes.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+from entity_c import Edict
+from memory_c import Pointer
+#   Entities
+from entities.attributes import EntityAttributes
+from entities.functions import EntityFunctions
+from entities.keyvalues import EntityKeyValues
+from entities.offsets import EntityOffsets
+from entities.properties import EntityProperties
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+# Set all to an empty list
+__all__ = []
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _FunctionDescriptor(object):
+    '''Descriptor used to get an entity's dynamic function.  Since it
+        has no __set__ method, values set on the instance are used.'''
+
+    def __init__(self, function):
+        '''Stores the function instance'''
+        self.function = function
+
+    def __get__(self, instance, owner):
+        '''Returns the function with the entity's pointer as the current one'''
+
+        # Was the descriptor retrieved from the class?
+        if instance is None:
+            return self
+
+        # Get the function so that we don't have to make multiple calls
+        function = self.function
+
+        # Does the entity's pointer need to be added to the arguments?
+        if function.pointer_index != -1:
+
+            # Set the entity's pointer as the current one
+            function.current_pointer = instance.pointer
+
+        # Return the pre call function method
+        return function._pre_call_function
+
+
+class _EntityClasses(dict):
+    '''Dictionary that stores the classes created for each
+        class and set of entity names.  Each class has a descriptor
+        for each property, keyvalue, offset, and function of
+        the entities, so that they are found without __getattr__.
+        Each class also stores the setter for each property, keyvalue,
+        and offset and the private attributes that can be set, so
+        that __setattr__ does not need to search for them.'''
+
+    def get_entity_class(self, cls, entities):
+        '''Returns the class to use for the given class and entities'''
+
+        # Was one of the created classes given?
+        if '_attributes_generation' in cls.__dict__:
+
+            # Use the class it was created from
+            cls = cls.__bases__[0]
+
+        # Get the key for the class
+        key = (cls, entities)
+
+        # Get the created class
+        entity_class = self.get(key)
+
+        # Does the class need created (again, if the data was reloaded)?
+        if (entity_class is None or entity_class._attributes_generation !=
+                EntityAttributes.generation):
+
+            # Create the class
+            entity_class = self[key] = self._create_class(cls, entities)
+
+        # Return the class
+        return entity_class
+
+    def _create_class(self, cls, entities):
+        '''Creates a class with descriptors for the given entities'''
+
+        # Get the settable descriptors from the lowest to the highest priority
+        setters = dict()
+        setters.update(self._get_offset_descriptors(entities))
+        setters.update(self._get_keyvalue_descriptors(entities))
+        setters.update(self._get_property_descriptors(entities))
+
+        # Get all descriptors, with functions having the lowest priority
+        descriptors = self._get_function_descriptors(entities)
+        descriptors.update(setters)
+
+        # Create the attributes for the new class
+        attributes = {
+            '__module__': cls.__module__,
+            '__doc__': cls.__doc__,
+            '_attributes_generation': EntityAttributes.generation,
+            '_setters': dict(
+                (name, setters[name].fset) for name in setters),
+            '_private_attributes': frozenset(
+                '_' + name for name in dir(cls) if isinstance(
+                    getattr(cls, name, None), property)),
+        }
+
+        # Loop through all descriptors
+        for name, descriptor in descriptors.items():
+
+            # Is the name already used by the class?
+            if hasattr(cls, name):
+                continue
+
+            # Is the name used by one of the instances?
+            # Those attributes are found first by __getattr__.
+            if any(hasattr(instance_type, name)
+                    for instance_type in cls._instance_types):
+                continue
+
+            # Add the descriptor
+            attributes[name] = descriptor
+
+        # Return the new class
+        return type(cls.__name__, (cls, ), attributes)
+
+    @staticmethod
+    def _get_property_descriptors(entities):
+        '''Returns the descriptors for the properties of the given entities'''
+
+        # Create an empty dictionary
+        descriptors = dict()
+
+        # Loop through all properties
+        for name, prop in EntityProperties.get_game_attributes(
+                entities).items():
+
+            # Add the descriptor for the property
+            descriptors[name] = property(*_get_property_methods(prop))
+
+        # Return the descriptors
+        return descriptors
+
+    @staticmethod
+    def _get_keyvalue_descriptors(entities):
+        '''Returns the descriptors for the keyvalues of the given entities'''
+
+        # Create an empty dictionary
+        descriptors = dict()
+
+        # Loop through all keyvalues
+        for name, value_type in EntityKeyValues.get_game_attributes(
+                entities).items():
+
+            # Add the descriptor for the keyvalue
+            descriptors[name] = property(
+                *_get_keyvalue_methods(name, value_type))
+
+        # Return the descriptors
+        return descriptors
+
+    @staticmethod
+    def _get_offset_descriptors(entities):
+        '''Returns the descriptors for the offsets of the given entities'''
+
+        # Create an empty dictionary
+        descriptors = dict()
+
+        # Loop through all offsets
+        for name, offset in EntityOffsets.get_game_attributes(
+                entities).items():
+
+            # Add the descriptor for the offset
+            descriptors[name] = property(*_get_offset_methods(offset))
+
+        # Return the descriptors
+        return descriptors
+
+    @staticmethod
+    def _get_function_descriptors(entities):
+        '''Returns the descriptors for the functions of the given entities'''
+
+        # Create an empty dictionary
+        descriptors = dict()
+
+        # Loop through all functions
+        for name, function in EntityFunctions.get_game_attributes(
+                entities).items():
+
+            # Add the descriptor for the function
+            descriptors[name] = _FunctionDescriptor(function)
+
+        # Return the descriptors
+        return descriptors
+
+# Get the _EntityClasses instance
+EntityClasses = _EntityClasses()
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _get_property_methods(prop):
+    '''Returns the getter and setter for the given property'''
+
+    # Get the PropHandle's methods
+    get_value = prop.handle.get_value
+    set_value = prop.handle.set_value
+
+    # Is the property a True/False property?
+    if 'True' in prop:
+
+        # Get the "True" value
+        true_value = prop['True']
+
+        def fget(self):
+            '''Returns if the current value equals the "True" value'''
+            return get_value(self._edict) == true_value
+
+        def fset(self, value):
+            '''Sets the property to the value for the given bool'''
+            set_value(self._edict, prop[str(value)])
+
+    # Is the property a normal property?
+    else:
+
+        def fget(self):
+            '''Returns the value of the property'''
+            return get_value(self._edict)
+
+        def fset(self, value):
+            '''Sets the value of the property'''
+            set_value(self._edict, value)
+
+    # Return the methods
+    return fget, fset
+
+
+def _get_keyvalue_methods(name, value_type):
+    '''Returns the getter and setter for the given keyvalue'''
+
+    # Get the edict's methods
+    get_key_value = getattr(Edict, 'get_key_value_{0}'.format(value_type))
+    set_key_value = getattr(Edict, 'set_key_value_{0}'.format(value_type))
+
+    def fget(self):
+        '''Returns the value of the keyvalue'''
+        return get_key_value(self._edict, name)
+
+    def fset(self, value):
+        '''Sets the value of the keyvalue'''
+        set_key_value(self._edict, name, value)
+
+    # Return the methods
+    return fget, fset
+
+
+def _get_offset_methods(offset):
+    '''Returns the getter and setter for the given offset'''
+
+    # Get the pointer's methods and the offset's value
+    get_value = getattr(Pointer, 'get_{0}'.format(offset.type))
+    set_value = getattr(Pointer, 'set_{0}'.format(offset.type))
+    value_offset = offset.offset
+
+    def fget(self):
+        '''Returns the value of the offset'''
+        return get_value(self.pointer, value_offset)
+
+    def fset(self, value):
+        '''Sets the value of the offset'''
+        set_value(self.pointer, value, value_offset)
+
+    # Return the methods
+    return fget, fset
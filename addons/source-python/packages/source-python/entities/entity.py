@@ -5,8 +5,11 @@
 # =============================================================================
 # Source.Python Imports
 from conversions_c import edict_from_index
+from entity_c import Edict
 from memory_c import Pointer
 #   Entities
+from entities.cache import EntityCache
+from entities.classes import EntityClasses
 from entities.functions import EntityFunctions
 from entities.keyvalues import EntityKeyValues
 from entities.offsets import EntityOffsets
@@ -30,9 +33,15 @@ __all__ = [
 class BaseEntity(object):
     '''Class used to interact directly with entities'''
 
+    # Store the types of the objects yielded by the instances property
+    _instance_types = (Edict, )
+
     def __new__(cls, index, *entities):
         '''Override the __new__ class method to verify the given index
-            is of the correct entity type and add the index attribute'''
+            is of the correct entity type and add the index attribute.
+            The object is created from a class that has a descriptor
+            for each of the entities' properties, keyvalues, offsets,
+            and functions, so that they are found without __getattr__.'''
 
         # Get the given indexes edict
         edict = edict_from_index(index)
@@ -44,17 +53,29 @@ class BaseEntity(object):
             raise ValueError(
                 'Index "{0}" is not a proper entity index'.format(index))
 
+        # Get the entity names to use for the instance
+        entities = frozenset(list(entities) + ['entity'])
+
         # Create the object
-        self = object.__new__(cls)
+        self = object.__new__(EntityClasses.get_entity_class(cls, entities))
 
         # Set the entity's base attributes
         self._index = index
         self._edict = edict
-        self._entities = frozenset(list(entities) + ['entity'])
+        self._entities = entities
+
+        # Store the pointer as None until it is needed
+        self._pointer = None
 
         # Return the instance
         return self
 
+    @classmethod
+    def from_cache(cls, index, *entities):
+        '''Returns a cached instance for the given index.  The same
+            instance is returned until the entity's edict is freed.'''
+        return EntityCache.get_entity(cls, index, *entities)
+
     def __getattr__(self, attr):
         '''Finds if the attribute is valid and returns the appropriate value'''
 
@@ -101,8 +122,7 @@ class BaseEntity(object):
         prop = self.properties[item]
 
         # Get the property's value
-        value = getattr(
-            self.edict, 'get_prop_{0}'.format(prop.type))(prop.prop)
+        value = prop.handle.get_value(self.edict)
 
         # Is the property a True/False property?
         if 'True' in prop:
@@ -146,45 +166,30 @@ class BaseEntity(object):
         return function._pre_call_function
 
     def __setattr__(self, attr, value):
-        '''Finds if the attribute is value and sets its value'''
-
-        # Is the given attribute private?
-        if attr.startswith('_'):
+        '''Finds if the attribute is value and sets its value.  The
+            setters and private attributes are stored by the class.'''
 
-            # Get the name of the private attribute
-            name = attr[1:]
+        # Get the setter for the property, keyvalue, or offset
+        setter = self._setters.get(attr)
 
-            # Is the attribute a property?
-            if (name in dir(self) and isinstance(
-                    getattr(self.__class__, name), property)):
+        # Is the attribute a property, keyvalue, or offset of this entity?
+        if setter is not None:
 
-                # Set the private attribute's value
-                super(BaseEntity, self).__setattr__(attr, value)
+            # Set the value
+            setter(self, value)
 
-                # No need to go further
-                return
-
-            # If not a property, do not allow the private attribute
-            raise ValueError(
-                'Invalid private attribute "{0}" given.'.format(attr))
-
-        # Is the attribute a property of this entity?
-        if attr in self.properties:
-
-            # Set the property's value
-            self._set_property(attr, value)
-
-        # Is the attribute a keyvalue of this entity?
-        elif attr in self.keyvalues:
+        # Is the given attribute private?
+        elif attr.startswith('_'):
 
-            # Set the keyvalue's value
-            self._set_keyvalue(attr, value)
+            # Is the attribute not used by a property?
+            if not attr in self._private_attributes:
 
-        # Is the attribute an offset of this entity?
-        elif attr in self.offsets:
+                # If not a property, do not allow the private attribute
+                raise ValueError(
+                    'Invalid private attribute "{0}" given.'.format(attr))
 
-            # Set the offset's value
-            self._set_offset(attr, value)
+            # Set the private attribute's value
+            super(BaseEntity, self).__setattr__(attr, value)
 
         # Was the attribute not found?
         else:
@@ -205,7 +210,7 @@ class BaseEntity(object):
             value = prop[str(value)]
 
         # Set the property's value
-        getattr(self.edict, 'set_prop_{0}'.format(prop.type))(prop.prop, value)
+        prop.handle.set_value(self.edict, value)
 
     def _set_keyvalue(self, item, value):
         '''Sets the value of the given keyvalue'''
@@ -317,8 +322,21 @@ class BaseEntity(object):
 
     @property
     def pointer(self):
-        '''Returns the entity's pointer'''
-        return Pointer(self.edict.get_unknown().get_base_entity())
+        '''Returns the entity's pointer.  The pointer is stored until
+            the entity's edict is freed or its client disconnects.'''
+
+        # Get the current serial of the entity's index
+        serial = EntityCache.serials.get(self._index, 0)
+
+        # Is there no stored pointer for the current serial?
+        if self._pointer is None or self._pointer[0] != serial:
+
+            # Store the serial and the pointer
+            self._pointer = (
+                serial, Pointer(self._edict.get_unknown().get_base_entity()))
+
+        # Return the pointer
+        return self._pointer[1]
 
     @property
     def properties(self):
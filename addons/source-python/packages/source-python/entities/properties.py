@@ -4,6 +4,7 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python Imports
+from entity_c import PropHandle
 #   Entities
 from entities.attributes import EntityAttributes
 
@@ -22,6 +23,15 @@ class _PropertyInstance(dict):
     '''Stores properties as a dictionary and
         allows access to them via attributes'''
 
+    def __init__(self, *args, **kwargs):
+        '''Stores the PropHandle used to get and set the property'''
+
+        # Call the super class' __init__
+        super(_PropertyInstance, self).__init__(*args, **kwargs)
+
+        # Store the PropHandle for the property
+        self.handle = PropHandle(self['prop'])
+
     def __getattr__(self, attr):
         '''Override the __getattr__ method to
             return the item within the dictionary'''
@@ -0,0 +1,193 @@
+# ../entities/registry.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+from entity_c import EntityGenerator
+from listener_c import ClientPutInServerListenerManager
+from listener_c import OnEdictAllocatedListenerManager
+from listener_c import OnEdictFreedListenerManager
+from listener_c import TickListenerManager
+#   Entities
+from entities.helpers import index_from_edict
+from entities.properties import EntityProperties
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+# Add all the global variables to __all__
+__all__ = [
+    'EntityRegistry',
+]
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _EntityRegistry(dict):
+    '''Dictionary that stores the edicts of all live entities by their
+        classname and index.  It is updated as edicts are allocated and
+        freed, so getting the entities of a classname does not need to
+        loop through every edict on the server.  Allocated edicts are
+        added on the next tick or lookup, as their classname is only
+        known once they are created.'''
+
+    def __init__(self, *args, **kwargs):
+        '''Creates the index dictionary and the pending list'''
+
+        # Call the super class' __init__
+        super(_EntityRegistry, self).__init__(*args, **kwargs)
+
+        # Store the classname of each registered index
+        self._classnames = dict()
+
+        # Store the edicts that were allocated since the last update
+        self._pending = list()
+
+    def __missing__(self, classname):
+        '''Returns an empty dictionary for unregistered classnames'''
+        return dict()
+
+    def get_edicts(self, *classnames):
+        '''Returns a list of the edicts of the given
+            classnames, sorted by their index'''
+
+        # Are there any pending edicts?
+        if self._pending:
+
+            # Add the pending edicts
+            self._add_pending_edicts()
+
+        # Get the edicts of the classnames by their index
+        edicts = dict()
+        for classname in classnames:
+            edicts.update(self[classname])
+
+        # Return the edicts in index order
+        return [edicts[index] for index in sorted(edicts)]
+
+    def get_indexes(self, classname):
+        '''Returns a list of the indexes of the given classname'''
+
+        # Are there any pending edicts?
+        if self._pending:
+
+            # Add the pending edicts
+            self._add_pending_edicts()
+
+        # Return the classname's indexes
+        return list(self[classname])
+
+    def get_owned_indexes(self, inthandle, classname):
+        '''Returns a list of the indexes of the given classname
+            that are owned by the entity with the given inthandle'''
+
+        # Are there any pending edicts?
+        if self._pending:
+
+            # Add the pending edicts
+            self._add_pending_edicts()
+
+        # Get the PropHandle of the entity "owner" property.
+        # The owner is read each time, since it can change at any time.
+        get_owner = EntityProperties.get_game_attributes(
+            ['entity'])['owner'].handle.get_value
+
+        # Return the indexes owned by the given inthandle
+        return [
+            index for index, edict in self[classname].items()
+            if get_owner(edict) == inthandle]
+
+    def add_edict(self, edict):
+        '''Adds the given edict to its classname'''
+
+        # Get the edict's index and classname
+        index = index_from_edict(edict)
+        classname = edict.get_class_name()
+
+        # Is the index already registered under another classname?
+        if self._classnames.get(index, classname) != classname:
+
+            # Remove the index from its old classname
+            self.remove_index(index)
+
+        # Add the edict
+        self._classnames[index] = classname
+        self.setdefault(classname, dict())[index] = edict
+
+    def remove_index(self, index):
+        '''Removes the given index from its classname'''
+
+        # Get the index's classname
+        classname = self._classnames.pop(index, None)
+
+        # Is the index not registered?
+        if classname is None:
+            return
+
+        # Remove the index
+        edicts = self[classname]
+        del edicts[index]
+
+        # Are there no more edicts of the classname?
+        if not edicts:
+
+            # Remove the classname
+            del self[classname]
+
+    def _add_pending_edicts(self):
+        '''Adds the pending edicts to their classname'''
+
+        # Get the pending edicts
+        pending = self._pending
+        self._pending = list()
+
+        # Loop through all pending edicts
+        for edict in pending:
+
+            # Is the edict no longer valid?
+            if edict.is_free():
+                continue
+
+            # Has the edict's classname not been set yet?
+            # This happens if it is looked up while it is being allocated.
+            if not edict.get_class_name():
+
+                # Add the edict on the next update
+                self._pending.append(edict)
+                continue
+
+            # Add the edict
+            self.add_edict(edict)
+
+    def _add_pending(self, edict, *args):
+        '''Stores the allocated edict to be added on the next update'''
+        self._pending.append(edict)
+
+    def _remove_edict(self, edict):
+        '''Removes the freed edict'''
+        self.remove_index(index_from_edict(edict))
+
+    def _tick(self):
+        '''Adds the pending edicts'''
+
+        # Are there any pending edicts?
+        if self._pending:
+
+            # Add the pending edicts
+            self._add_pending_edicts()
+
+# Get the _EntityRegistry instance
+EntityRegistry = _EntityRegistry()
+
+# Add all current entities
+for _edict in EntityGenerator():
+    EntityRegistry.add_edict(_edict)
+
+# Register the listeners
+TickListenerManager.register_listener(EntityRegistry._tick)
+OnEdictAllocatedListenerManager.register_listener(EntityRegistry._add_pending)
+ClientPutInServerListenerManager.register_listener(EntityRegistry._add_pending)
+OnEdictFreedListenerManager.register_listener(EntityRegistry._remove_edict)
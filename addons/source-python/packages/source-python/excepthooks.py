@@ -13,6 +13,7 @@ from traceback import format_exception
 
 # Source.Python Imports
 from loggers import _SPLogger
+from loggers import _dump_memory_logs
 from paths import GAME_PATH
 #   Translations
 from translations.strings import LangStrings
@@ -122,6 +123,9 @@ class _ExceptHooks(list):
         # Print a blank line to separate the console
         ExceptHooksLogger.log_exception(message + '\n\n')
 
+        # Write the messages logged before the exception to the log files
+        _dump_memory_logs()
+
 # Get the _ExceptHooks instance
 ExceptHooks = _ExceptHooks()
 
@@ -33,62 +33,104 @@ class _IterObject(object):
         self._not_filters = not_filters
         self._return_types = return_types
 
+        # Get the functions used to validate items and
+        # get their return values, so that iterating
+        # does not need to look them up for each item
+        self._is_valid = self._get_validator(is_filters, not_filters)
+        self._get_return_value = self._get_return_function(return_types)
+
     def __iter__(self):
         '''Iterates through the class objects
             and filters out any unneeded ones'''
 
+        # Get the compiled functions
+        is_valid = self._is_valid
+        get_return_value = self._get_return_value
+
         # Loop through the items in classes iterator
         for item in self.iterator():
 
             # Is the current item yieldable?
-            if not self._is_valid(item):
+            if is_valid(item):
+
+                # Yield the proper type(s) for the current item
+                yield get_return_value(item)
+
+    def _get_validator(self, is_filters, not_filters):
+        '''Returns a function that returns whether
+            the given item is valid for the given filters'''
+
+        # Get the functions of the filters
+        is_functions = tuple(
+            self.manager._filters[filter_name] for filter_name in is_filters)
+        not_functions = tuple(
+            self.manager._filters[filter_name] for filter_name in not_filters)
+
+        # Are there no filters?
+        if not is_functions and not not_functions:
 
-                # If not, move to the next item
-                continue
+            # Return a function that validates all items
+            return _is_always_valid
 
-            # Are the return types a string?
-            if isinstance(self._return_types, str):
+        # Is there only one "is" filter?
+        if len(is_functions) == 1 and not not_functions:
 
-                # Yield the proper type for the current item
-                yield self.manager._return_types[self._return_types](item)
+            # Return the filter itself
+            return is_functions[0]
 
-            # Otherwise
-            else:
+        def is_valid(item):
+            '''Returns whether the given item is valid for the filters'''
 
-                # Create an empty list to yield
-                yield_list = []
+            # Loop through all "is" filters
+            for function in is_functions:
 
-                # Loop through all of the return types
-                for return_type in self._return_types:
+                # Does the item pass this filter?
+                if not function(item):
 
-                    # Add the current return type for
-                    # the current item to the yield list
-                    yield_list.append(
-                        self.manager._return_types[return_type](item))
+                    # If not, return False
+                    return False
 
-                # Yield the list of return types for the current item
-                yield yield_list
+            # Loop through all "not" filters
+            for function in not_functions:
 
-    def _is_valid(self, item):
-        '''Returns whether the given item is valid for the instances filters'''
+                # Does the item pass this filter?
+                if function(item):
 
-        # Loop through all "is" filters
-        for filter_name in self._is_filters:
+                    # If it does, return False since these are "not" filters
+                    return False
 
-            # Does the item pass this filter?
-            if not self.manager._filters[filter_name](item):
+            # If all checks pass, return True
+            return True
 
-                # If not, return False
-                return False
+        # Return the function
+        return is_valid
 
-        # Loop through all "not" filters
-        for filter_name in self._not_filters:
+    def _get_return_function(self, return_types):
+        '''Returns a function that returns the
+            given return type(s) for the given item'''
 
-            # Does the item pass this filter?
-            if self.manager._filters[filter_name](item):
+        # Is the return type a string?
+        if isinstance(return_types, str):
 
-                # If it does, return False since these are "not" filters
-                return False
+            # Return the return type's function
+            return self.manager._return_types[return_types]
 
-        # If all checks pass, return True
-        return True
+        # Get the functions of the return types
+        functions = tuple(
+            self.manager._return_types[return_type]
+            for return_type in return_types)
+
+        def get_return_values(item):
+            '''Returns a list of the return types for the given item'''
+            return [function(item) for function in functions]
+
+        # Return the function
+        return get_return_values
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _is_always_valid(item):
+    '''Returns True for iterators without filters'''
+    return True
@@ -8,10 +8,13 @@
 from configobj import ConfigObj
 
 # Source.Python Imports
-from engine_c import EngineServer
+from listener_c import ClientDisconnectListenerManager
+from listener_c import ClientPutInServerListenerManager
 from player_c import PlayerGenerator
 from core import GAME_NAME
 from paths import SP_DATA_PATH
+#   Events
+from events.manager import EventRegistry
 #   Filters
 from filters.iterator import _IterObject
 from filters.manager import _BaseFilterManager
@@ -19,9 +22,13 @@ from filters.manager import _BaseFilterManager
 from players.entity import PlayerEntity
 from players.helpers import address_from_playerinfo
 from players.helpers import basehandle_from_playerinfo
+from players.helpers import cl_language_from_index
 from players.helpers import edict_from_playerinfo
+from players.helpers import index_from_edict
 from players.helpers import index_from_playerinfo
+from players.helpers import index_from_userid
 from players.helpers import inthandle_from_playerinfo
+from players.helpers import playerinfo_from_index
 from players.helpers import pointer_from_playerinfo
 from players.helpers import uniqueid_from_playerinfo
 from players.helpers import userid_from_playerinfo
@@ -63,6 +70,61 @@ class PlayerIter(_IterObject):
     # Store the base iterator
     iterator = staticmethod(PlayerGenerator)
 
+    def __init__(self, is_filters=[], not_filters=[], return_types='index'):
+        '''Gets the masks to use if all filters are built-in filters'''
+
+        # Call the super class' __init__
+        super(PlayerIter, self).__init__(
+            is_filters, not_filters, return_types)
+
+        # Get the mask keys of the filters
+        self._is_keys = _PlayerMasksInstance.get_keys(self._is_filters)
+        self._not_keys = _PlayerMasksInstance.get_keys(self._not_filters)
+
+    def __iter__(self):
+        '''Iterates through only the matching players
+            if all filters are built-in filters'''
+
+        # Does any filter not have a mask?
+        if self._is_keys is None or self._not_keys is None:
+
+            # Loop through and filter all players
+            for item in super(PlayerIter, self).__iter__():
+                yield item
+
+            # No need to go further
+            return
+
+        # Get the mask of the players that pass all filters
+        mask = _PlayerMasksInstance['all']
+        for key in self._is_keys:
+            mask &= _PlayerMasksInstance[key]
+        for key in self._not_keys:
+            mask &= ~_PlayerMasksInstance[key]
+
+        # Get the return type function
+        get_return_value = self._get_return_value
+
+        # Loop through the players in the mask, lowest index first
+        while mask:
+
+            # Get the lowest player in the mask
+            bit = mask & -mask
+            mask ^= bit
+            index = bit.bit_length() - 1
+
+            # Is the index the only value needed?
+            if get_return_value is index_from_playerinfo:
+
+                # Yield the index
+                yield index
+
+            # Otherwise
+            else:
+
+                # Yield the proper type(s) for the player
+                yield get_return_value(playerinfo_from_index(index))
+
 
 # =============================================================================
 # PLAYER TEAM CLASSES
@@ -160,6 +222,217 @@ for number, team in enumerate(('un', 'spec', 't', 'ct')):
         team, _PlayerTeamsInstance[team]._player_is_on_team)
 
 
+# =============================================================================
+# >> PLAYER MASK CLASSES
+# =============================================================================
+class _PlayerMasks(dict):
+    '''Dictionary that stores a bitmask of the indexes of the players that
+        pass each built-in filter.  The masks are updated by the client
+        listeners and the player_spawn, player_death, and player_team
+        events, so PlayerIter can get the players that pass built-in
+        filters without checking all players.'''
+
+    def __init__(self):
+        '''Stores the built-in filters and adds all current players'''
+
+        # Call the super class' __init__
+        super(_PlayerMasks, self).__init__()
+
+        # Store the function and mask key of each built-in filter
+        self._filters = {
+            'all': (_is_player, 'all'),
+            'bot': (_player_is_bot, 'bot'),
+            'human': (_player_is_human, 'human'),
+            'alive': (_player_is_alive, 'alive'),
+            'dead': (_player_is_dead, 'dead'),
+        }
+
+        # Loop through all team filters
+        for team, instance in _PlayerTeamsInstance.items():
+
+            # Use the team number as the mask key
+            self._filters[team] = (instance._player_is_on_team, instance.team)
+
+        # Loop through all current players
+        for player in PlayerGenerator():
+
+            # Add the player
+            self.update_player(index_from_playerinfo(player))
+
+    def __missing__(self, key):
+        '''Returns an empty mask for keys without players'''
+        return 0
+
+    def get_keys(self, filters):
+        '''Returns the mask keys of the given filters, or None
+            if any of them is not a registered built-in filter'''
+
+        # Create an empty list
+        keys = list()
+
+        # Loop through all filters
+        for filter_name in filters:
+
+            # Is the filter not a built-in filter?
+            if not filter_name in self._filters:
+                return None
+
+            # Get the built-in filter's function and mask key
+            function, key = self._filters[filter_name]
+
+            # Was the filter replaced with another function?
+            # Team filters are bound methods, so they are compared by value.
+            if _PlayerIterManagerInstance._filters.get(
+                    filter_name) != function:
+                return None
+
+            # Add the filter's mask key
+            keys.append(key)
+
+        # Return the mask keys
+        return keys
+
+    def update_player(self, index):
+        '''Updates all masks for the given player'''
+
+        # Remove the player from all masks
+        self.remove_player(index)
+
+        # Get the player's PlayerInfo instance
+        player = playerinfo_from_index(index)
+
+        # Get the player's bit
+        bit = 1 << index
+
+        # Add the player to the masks of the filters the player passes
+        self['all'] |= bit
+        if player.is_fake_client():
+            self['bot'] |= bit
+        if player.is_player():
+            self['human'] |= bit
+        self['dead' if player.is_dead() else 'alive'] |= bit
+        self[player.get_team_index()] |= bit
+
+    def remove_player(self, index):
+        '''Removes the given player from all masks'''
+
+        # Get the mask without the player's bit
+        mask = ~(1 << index)
+
+        # Remove the player from all masks
+        for key in self:
+            self[key] &= mask
+
+    def set_alive(self, index, alive):
+        '''Sets whether the given player is in the alive or dead mask'''
+
+        # Get the player's bit
+        bit = 1 << index
+
+        # Move the player to the proper mask
+        self['alive' if alive else 'dead'] |= bit
+        self['dead' if alive else 'alive'] &= ~bit
+
+    def set_team(self, index, team):
+        '''Moves the given player to the given team's mask'''
+
+        # Get the player's bit
+        bit = 1 << index
+
+        # Remove the player from all team masks
+        for key in self:
+            if isinstance(key, int):
+                self[key] &= ~bit
+
+        # Add the player to the team's mask
+        self[team] |= bit
+
+    def _client_put_in_server(self, edict, name):
+        '''Adds the player that was put in the server'''
+        self.update_player(index_from_edict(edict))
+
+    def _client_disconnect(self, edict):
+        '''Removes the disconnected player'''
+        self.remove_player(index_from_edict(edict))
+
+    def _player_spawn(self, game_event):
+        '''Gets whether the spawned player is alive from the player,
+            since some games also fire player_spawn for spectators'''
+
+        # Get the event's player index
+        index = self._get_event_index(game_event)
+
+        # Is the player not known?
+        if index is None:
+            return
+
+        # Update whether the player is alive
+        self.set_alive(index, not playerinfo_from_index(index).is_dead())
+
+    def _player_death(self, game_event):
+        '''Moves the killed player to the dead mask.  The player's life
+            state is not dead yet when the event is fired, so it is
+            not read from the player.'''
+
+        # Get the event's player index
+        index = self._get_event_index(game_event)
+
+        # Is the player not known?
+        if index is None:
+            return
+
+        # Move the player to the dead mask
+        self.set_alive(index, False)
+
+    def _get_event_index(self, game_event):
+        '''Returns the index of the event's player, or None if unknown'''
+
+        # Get the player's index
+        index = index_from_userid(game_event.get_int('userid'))
+
+        # Is the player not known?
+        if not self['all'] & (1 << index):
+            return None
+
+        # Return the player's index
+        return index
+
+    def _player_team(self, game_event):
+        '''Moves the player to the new team's mask'''
+
+        # Is the player disconnecting?
+        if game_event.get_bool('disconnect'):
+            return
+
+        # Get the event's player index
+        index = self._get_event_index(game_event)
+
+        # Is the player not known?
+        if index is None:
+            return
+
+        # Move the player to the new team, as the event
+        # is fired before the player's team is changed
+        self.set_team(index, game_event.get_int('team'))
+
+# Get the _PlayerMasks instance
+_PlayerMasksInstance = _PlayerMasks()
+
+# Register the listeners
+ClientPutInServerListenerManager.register_listener(
+    _PlayerMasksInstance._client_put_in_server)
+ClientDisconnectListenerManager.register_listener(
+    _PlayerMasksInstance._client_disconnect)
+
+# Register for the events
+EventRegistry.register_for_event(
+    'player_spawn', _PlayerMasksInstance._player_spawn)
+EventRegistry.register_for_event(
+    'player_death', _PlayerMasksInstance._player_death)
+EventRegistry.register_for_event(
+    'player_team', _PlayerMasksInstance._player_team)
+
+
 # =============================================================================
 # >> RETURN TYPE FUNCTIONS
 # =============================================================================
@@ -220,8 +493,7 @@ def _return_weapon(PlayerInfo):
 
 def _return_language(PlayerInfo):
     '''Returns the player's language'''
-    return EngineServer.get_client_convar_value(
-        index_from_playerinfo(PlayerInfo), 'cl_language')
+    return cl_language_from_index(index_from_playerinfo(PlayerInfo))
 
 
 def _return_team(PlayerInfo):
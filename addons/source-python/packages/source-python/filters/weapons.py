@@ -4,13 +4,13 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python Imports
-from entity_c import EntityGenerator
 #   Entities
 from entities.entity import BaseEntity
 from entities.helpers import basehandle_from_edict
 from entities.helpers import index_from_edict
 from entities.helpers import inthandle_from_edict
 from entities.helpers import pointer_from_edict
+from entities.registry import EntityRegistry
 #   Filters
 from filters.iterator import _IterObject
 from filters.manager import _BaseFilterManager
@@ -48,14 +48,11 @@ class WeaponEdictIter(_IterObject):
     def iterator():
         '''Iterates over only weapon entities'''
 
-        # Loop through all entities on the server
-        for edict in EntityGenerator():
+        # Loop through the entities of all weapon types in index order
+        for edict in EntityRegistry.get_edicts(*WeaponManager):
 
-            # Is the entity a weapon?
-            if edict.get_class_name() in WeaponManager:
-
-                # Yield the entity
-                yield edict
+            # Yield the entity
+            yield edict
 
 
 # =============================================================================
@@ -4,20 +4,34 @@
 # >> IMPORTS
 # =============================================================================
 # Python Imports
+#   Collections
+from collections import deque
+#   Contextlib
+from contextlib import contextmanager
 #   Logging
 from logging import CRITICAL
 from logging import DEBUG
 from logging import ERROR
 from logging import INFO
 from logging import WARNING
-from logging import FileHandler
 from logging import Formatter
+from logging import Handler
 from logging import addLevelName
 from logging import getLogger
+#   Threading
+from threading import Event
+from threading import Lock
+from threading import Thread
+#   Time
+from time import time
+#   Weakref
+from weakref import ref
 
 # Source.Python Imports
 from cvar_c import ConVar
 from engine_c import EngineServer
+from listener_c import LevelShutdownListenerManager
+from listener_c import TickListenerManager
 from core import echo_console
 from paths import LOG_PATH
 
@@ -39,6 +53,11 @@ CONSOLE = 1 << 0
 MAIN_LOG = 1 << 1
 SP_LOG = 1 << 2
 SCRIPT_LOG = 1 << 3
+MEMORY_LOG = 1 << 4
+
+# Store the log file queue overflow constants
+OVERFLOW_DROP_OLDEST = 1
+OVERFLOW_BLOCK = 2
 
 # Store the new level names
 MESSAGE = 60
@@ -51,13 +70,165 @@ addLevelName(EXCEPTION, 'EXCEPTION')
 # Store a formatter for use with the main log
 _main_log_formatter = Formatter('- %(name)s\t-\t%(levelname)s\n\t%(message)s')
 
-# Store a formatter for use with dumps
-_clean_formatter = Formatter('%(message)s')
+# Store a level value that no message reaches (used when no areas are set)
+_DISABLED = MESSAGE + 1
+
+# Store a level value that all messages reach (used for the memory log)
+_ALL_LEVELS = 0
+
+# Store weak references to all LogManager instances
+# so that their cached values can be refreshed
+_log_managers = list()
 
 
 # =============================================================================
 # >> CLASSES
 # =============================================================================
+class _QueuedFileHandler(Handler):
+    '''Handler that queues records and writes them to
+        the log file in batches from a background thread'''
+
+    def __init__(
+            self, filename, queue_size=4096,
+            overflow=OVERFLOW_DROP_OLDEST, interval=0.5):
+        '''Stores the queue values and starts the writer thread'''
+
+        # Call the base __init__
+        super(_QueuedFileHandler, self).__init__()
+
+        # Store the file to write to
+        self.filename = filename
+
+        # Store the queue values
+        self._queue = deque()
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._interval = interval
+
+        # Store the number of records dropped due to a full queue
+        self.dropped = 0
+
+        # Open the file to write to
+        self.stream = open(filename, 'a')
+
+        # Store the objects used to control the writer thread
+        self._write_lock = Lock()
+        self._wakeup = Event()
+        self._closing = False
+
+        # Start the writer thread
+        self._thread = Thread(
+            target=self._run, name='sp-log-writer-{0}'.format(filename))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def emit(self, record):
+        '''Adds the record to the queue'''
+
+        # Format the message now, as its arguments might change later
+        record.msg = record.getMessage()
+        record.args = None
+
+        # Add the record to the queue
+        self._enqueue(record)
+
+    def write_text(self, text):
+        '''Adds already formatted text to the queue to be written as is'''
+        self._enqueue(text)
+
+    def _enqueue(self, item):
+        '''Adds a record or text to the queue'''
+
+        # Is the queue full?
+        if len(self._queue) >= self._queue_size:
+
+            # Should the oldest record be dropped?
+            if self._overflow == OVERFLOW_DROP_OLDEST:
+
+                # Drop the oldest record
+                try:
+                    self._queue.popleft()
+                except IndexError:
+                    pass
+                self.dropped += 1
+
+            # Should the game thread wait for the queue to be written?
+            else:
+
+                # Write the queue to the file
+                self.flush()
+
+        # Add the item to the queue
+        self._queue.append(item)
+
+        # Is the queue half full and the writer thread waiting?
+        if (len(self._queue) >= self._queue_size >> 1 and
+                not self._wakeup.is_set()):
+
+            # Wake up the writer thread early
+            self._wakeup.set()
+
+    def flush(self):
+        '''Writes all queued records to the file'''
+
+        # Get the queue
+        queue = self._queue
+
+        # Only allow one thread to write at a time
+        with self._write_lock:
+
+            # Are there any records to write?
+            if not queue:
+                return
+
+            # Get the formatted records and text
+            lines = list()
+            while queue:
+                item = queue.popleft()
+                lines.append(
+                    item if isinstance(item, str)
+                    else self.format(item) + '\n')
+
+            # Write the records with one write call
+            try:
+                self.stream.write(''.join(lines))
+                self.stream.flush()
+
+            # Was an error encountered?
+            except:
+                self.handleError(None)
+
+    def close(self):
+        '''Writes all queued records and stops the writer thread'''
+
+        # Stop the writer thread
+        self._closing = True
+        self._wakeup.set()
+        self._thread.join()
+
+        # Write any remaining records
+        self.flush()
+
+        # Close the file
+        self.stream.close()
+
+        # Call the base close method
+        super(_QueuedFileHandler, self).close()
+
+    def _run(self):
+        '''Writes queued records until the handler is closed'''
+
+        # Loop until the handler is closed
+        while not self._closing:
+
+            # Wait for the interval or for the queue to fill up
+            self._wakeup.wait(self._interval)
+            self._wakeup.clear()
+
+            # Write the queued records
+            self.flush()
+
+
 class _LogInstance(dict):
     '''Base logging class used to create child logging instances'''
 
@@ -69,6 +240,14 @@ class _LogInstance(dict):
         # Store the parent instance
         self.parent = parent
 
+        # Store the root instance
+        self._root = parent.root
+
+        # Store the root's cached level and areas values
+        self._level_value = parent._level_value
+        self._output_level_value = parent._output_level_value
+        self._areas_value = parent._areas_value
+
         # Store a child logging instance
         self._logger = self.parent.logger.getChild(name)
 
@@ -103,44 +282,72 @@ class _LogInstance(dict):
             # Remove the child
             del self[item]
 
+    def is_enabled_for(self, level):
+        '''Returns whether a message of the given logging level would be
+            logged.  Use to avoid building expensive log messages.'''
+        return level >= self._level_value
+
     def log_critical(self, msg, *args, **kwargs):
         '''Use to call a critical message'''
-        self._log(CRITICAL, msg, *args, **kwargs)
+        if self._level_value <= CRITICAL:
+            self._log(CRITICAL, msg, *args, **kwargs)
 
     def log_debug(self, msg, *args, **kwargs):
         '''Use to call a debug message'''
-        self._log(DEBUG, msg, *args, **kwargs)
+        if self._level_value <= DEBUG:
+            self._log(DEBUG, msg, *args, **kwargs)
 
     def log_exception(self, msg, *args, **kwargs):
         '''Use to call an exception message'''
-        self._log(EXCEPTION, msg, *args, **kwargs)
+        if self._level_value <= EXCEPTION:
+            self._log(EXCEPTION, msg, *args, **kwargs)
 
     def log_info(self, msg, *args, **kwargs):
         '''Use to call a basic info message'''
-        self._log(INFO, msg, *args, **kwargs)
+        if self._level_value <= INFO:
+            self._log(INFO, msg, *args, **kwargs)
 
     def log_warning(self, msg, *args, **kwargs):
         '''Use to call a warning message'''
-        self._log(WARNING, msg, *args, **kwargs)
+        if self._level_value <= WARNING:
+            self._log(WARNING, msg, *args, **kwargs)
 
     def log_message(self, msg, *args, **kwargs):
         '''Use to call a message that should always print'''
-        self._log(MESSAGE, msg, *args, **kwargs)
+        if self._level_value <= MESSAGE:
+            self._log(MESSAGE, msg, *args, **kwargs)
 
     def log_dump(self, msg, *args, **kwargs):
-        '''Use to call a dump message'''
+        '''Use to call a dump message.  The text is written to the
+            log files without any prefix.'''
 
-        # Change the handler over to the clean handler,
-        # so that the text is logged without any prefix
-        self.root.logger.removeHandler(self.root._handler)
-        self.root.logger.addHandler(self.root._clean_handler)
+        # Does the message need logged?
+        if self._output_level_value > MESSAGE:
+            return
 
-        # Log the message
-        self._log(MESSAGE, msg, *args, dump=True, **kwargs)
+        # Get the message to log
+        message = msg % args if args else msg
 
-        # Revert the handler back to the original formatting
-        self.root.logger.removeHandler(self.root._clean_handler)
-        self.root.logger.addHandler(self.root._handler)
+        # Get the areas to be used
+        areas = self._areas_value
+
+        # Print to the main log file?
+        if MAIN_LOG & areas:
+
+            # Print to the main log
+            EngineServer.log_print(message + '\n')
+
+        # Print to the script's log file?
+        if SCRIPT_LOG & areas and self.root is not _SPLogger:
+
+            # Write the message to the script's log file
+            self.root._write_dump(message)
+
+        # Print to the main SP log file?
+        if SP_LOG & areas:
+
+            # Write the message to the SP log file
+            _SPLogger._write_dump(message)
 
     def log(self, level, msg, *args, **kwargs):
         '''Use to call a message with the given logging level'''
@@ -148,51 +355,53 @@ class _LogInstance(dict):
         # Get the value of the given level
         level = self._get_level_value(level)
 
-        # Call the main logging method
-        self._log(level, msg, *args, **kwargs)
-
-    def _log(self, level, msg, *args, dump=False, **kwargs):
-        '''Main logging method'''
-
         # Does the message need logged?
-        if self.level > level:
+        if self._level_value <= level:
 
-            # If not, simply return
-            return
+            # Call the main logging method
+            self._log(level, msg, *args, **kwargs)
+
+    def _log(self, level, msg, *args, **kwargs):
+        '''Main logging method.  The message is only formatted
+            with the given arguments once it is known to be logged.'''
 
         # Get the areas to be used
-        areas = self.areas
+        areas = self._areas_value
 
-        # Print to main log file?
-        if MAIN_LOG & areas:
+        # Store the message in memory?
+        if MEMORY_LOG & areas:
 
-            # Is a prefix supposed to be logged?
-            if not dump:
+            # Add the formatted message to the root's memory log.
+            # The arguments are not stored, so the message shows their
+            # state at the time it was logged and they are not kept alive.
+            self.root._memory.append(
+                (time(), self.logger, level, msg % args if args else msg))
 
-                # Create the record
-                record = self.logger.makeRecord(
-                    self.logger.name, level,
-                    '(unknown file)', 0, msg, args, None)
+            # Does the message need logged to any other area?
+            if level < self._output_level_value:
+                return
 
-                # Get the message to send
-                message = _main_log_formatter.format(record)
+        # Print to main log file?
+        if MAIN_LOG & areas:
 
-            # Is the message not supposed to have a prefix?
-            else:
+            # Create the record
+            record = self.logger.makeRecord(
+                self.logger.name, level,
+                '(unknown file)', 0, msg, args, None)
 
-                # Use the given message
-                message = msg
+            # Get the message to send
+            message = _main_log_formatter.format(record)
 
             # Print to the main log
             EngineServer.log_print(message + '\n')
 
         # Print to the console?
-        if CONSOLE & areas and not dump:
+        if CONSOLE & areas:
 
             # If not, print to the console
             # If <engine>.log_print is called with logging being on,
             #   the console is already echoed with the message.
-            echo_console(msg)
+            echo_console(msg % args if args else msg)
 
         # Print to the script's log file?
         if SCRIPT_LOG & areas and self.root != _SPLogger:
@@ -211,21 +420,25 @@ class _LogInstance(dict):
         '''Returns a level value used by the logging package'''
         return 50 - (10 * level)
 
-    @property
-    def root(self):
-        '''Returns the root class'''
+    def _set_cached_values(self, level, output_level, areas):
+        '''Stores the given level and areas values on the
+            instance and all of its children'''
 
-        # Store the current instance
-        instance = self
+        # Store the values
+        self._level_value = level
+        self._output_level_value = output_level
+        self._areas_value = areas
 
-        # Use a while statement to get the parent until root is found
-        while not instance.parent is None:
+        # Loop through all children
+        for child in self.values():
 
-            # Set the current instance to the parent
-            instance = instance.parent
+            # Store the values on the child
+            child._set_cached_values(level, output_level, areas)
 
-        # Return the root instance
-        return instance
+    @property
+    def root(self):
+        '''Returns the root class'''
+        return self._root
 
     @property
     def areas(self):
@@ -253,8 +466,13 @@ class LogManager(_LogInstance):
 
     def __init__(
             self, name, level, areas, filepath=None,
-            format=None, date_format=None):
-        '''Stores the base values and creates the logger'''
+            format=None, date_format=None, queue_size=4096,
+            overflow=OVERFLOW_DROP_OLDEST, memory_size=1024):
+        '''Stores the base values and creates the logger.  Records for
+            the log file are written by a background thread.  When more
+            than queue_size records are waiting, overflow decides whether
+            the oldest is dropped or the game thread writes them.  The
+            memory log keeps the last memory_size messages.'''
 
         # Store the base formatter
         self._formatter = Formatter(format, date_format)
@@ -263,9 +481,27 @@ class LogManager(_LogInstance):
         self._level = level
         self._areas = areas
 
+        # Store the instance as its own root
+        self._root = self
+
+        # Store the memory log
+        self._memory = deque(maxlen=memory_size)
+
+        # Store the cached level and areas values
+        self._level_value = _DISABLED
+        self._output_level_value = _DISABLED
+        self._areas_value = 0
+        self.refresh()
+
+        # Add the instance to the managers to refresh every tick
+        _log_managers.append(ref(self))
+
         # Create the logger
         self._logger = getLogger(name)
 
+        # Store the file handler (None when no filepath is given)
+        self._handler = None
+
         # Was a filepath given?
         if not filepath is None:
 
@@ -285,14 +521,138 @@ class LogManager(_LogInstance):
                 log_path.parent.makedirs()
 
             # Create the handler an add it to the logger
-            self._handler = FileHandler(LOG_PATH.joinpath(filepath + '.log'))
+            self._handler = _QueuedFileHandler(
+                LOG_PATH.joinpath(filepath + '.log'), queue_size, overflow)
             self._handler.setFormatter(self.formatter)
             self.logger.addHandler(self._handler)
 
-            # Create a clean handler for logging without a prefix
-            self._clean_handler = FileHandler(
-                LOG_PATH.joinpath(filepath + '.log'))
-            self._clean_handler.setFormatter(_clean_formatter)
+        # Store the list used to buffer dump text (None when not buffering)
+        self._dump_buffer = None
+
+    def refresh(self):
+        '''Updates the cached level and areas values from the ConVars.
+            This is called every tick, and can be called directly after
+            setting one of the ConVars to use its value immediately.'''
+
+        # Get the current values
+        output_level = self.level
+        areas = self.areas
+
+        # Are no areas other than the memory log set?
+        if not areas & ~MEMORY_LOG:
+
+            # Do not output any messages
+            output_level = _DISABLED
+
+        # Get the level needed for a message to be logged.
+        # The memory log stores messages of all levels.
+        level = _ALL_LEVELS if MEMORY_LOG & areas else output_level
+
+        # Have the values changed?
+        if (level != self._level_value or areas != self._areas_value or
+                output_level != self._output_level_value):
+
+            # Store the new values on all instances
+            self._set_cached_values(level, output_level, areas)
+
+    @contextmanager
+    def buffer_dumps(self):
+        '''Collects all dump text written inside the with
+            block and writes it to the log file at once'''
+
+        # Is the instance already buffering dumps?
+        if self._dump_buffer is not None:
+
+            # Let the outer block write the text
+            yield
+            return
+
+        # Start buffering dumps
+        self._dump_buffer = list()
+
+        # Use try/finally to always write the buffered text
+        try:
+            yield
+
+        finally:
+
+            # Get the buffered text
+            text = ''.join(self._dump_buffer)
+
+            # Stop buffering dumps
+            self._dump_buffer = None
+
+            # Write the text to the log file
+            if text:
+                self._handler.write_text(text)
+
+    def _write_dump(self, message):
+        '''Writes the dump message to the log file'''
+
+        # Does the instance have no log file?
+        if self._handler is None:
+            return
+
+        # Is the instance buffering dumps?
+        if self._dump_buffer is not None:
+
+            # Add the message to the buffer
+            self._dump_buffer.append(message + '\n')
+
+        # Is the instance not buffering dumps?
+        else:
+
+            # Write the message to the log file
+            self._handler.write_text(message + '\n')
+
+    def dump_memory(self, count=None):
+        '''Writes the last count messages (all if None) of the memory
+            log to the log file and clears the memory log'''
+
+        # Get the messages to write
+        messages = list(self._memory)
+        if count is not None:
+            messages = messages[-count:] if count > 0 else []
+
+        # Clear the memory log
+        self._memory.clear()
+
+        # Are there no messages to write?
+        if not messages:
+            return
+
+        # Get the instance to write the messages with
+        manager = self if self._handler is not None else _SPLogger
+
+        # Get the header of the dump
+        text = '{0} memory log ({1} messages):\n'.format(
+            self.logger.name, len(messages))
+
+        # Loop through all messages
+        for created, logger, level, message in messages:
+
+            # Create the record
+            record = logger.makeRecord(
+                logger.name, level, '(unknown file)', 0, message, None, None)
+
+            # Set the record's time to when the message was logged
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+
+            # Add the formatted message
+            text += self.formatter.format(record) + '\n'
+
+        # Write the messages to the log file
+        manager._write_dump(text.rstrip('\n'))
+
+    def flush(self):
+        '''Writes all queued records to the log file'''
+
+        # Does the instance have a log file?
+        if self._handler is not None:
+
+            # Write the queued records
+            self._handler.flush()
 
     @property
     def level(self):
@@ -318,3 +678,66 @@ _SPLogger = LogManager(
 
 # Set the parent logger level to allow all message types
 _SPLogger.logger.parent.level = DEBUG
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _refresh_log_managers():
+    '''Refreshes the cached values of all LogManager instances'''
+
+    # Loop through all LogManager references
+    for reference in list(_log_managers):
+
+        # Get the LogManager instance
+        manager = reference()
+
+        # Has the instance been removed?
+        if manager is None:
+
+            # Remove the reference
+            _log_managers.remove(reference)
+
+            # No need to go further
+            continue
+
+        # Refresh the instance's values
+        manager.refresh()
+
+
+def _dump_memory_logs(count=None):
+    '''Writes the memory log of all LogManager instances to the log files'''
+
+    # Loop through all LogManager references
+    for reference in list(_log_managers):
+
+        # Get the LogManager instance
+        manager = reference()
+
+        # Is the instance still available?
+        if manager is not None:
+
+            # Write the instance's memory log
+            manager.dump_memory(count)
+
+
+def _flush_log_managers():
+    '''Writes the queued records of all LogManager instances'''
+
+    # Loop through all LogManager references
+    for reference in list(_log_managers):
+
+        # Get the LogManager instance
+        manager = reference()
+
+        # Is the instance still available?
+        if manager is not None:
+
+            # Write the instance's queued records
+            manager.flush()
+
+# Refresh the cached values every tick, in case a ConVar changed
+TickListenerManager.register_listener(_refresh_log_managers)
+
+# Write all queued records when the map ends
+LevelShutdownListenerManager.register_listener(_flush_log_managers)
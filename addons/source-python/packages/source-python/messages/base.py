@@ -17,7 +17,6 @@ from imp import load_source
 from path import path
 
 # Source.Python Imports
-from engine_c import EngineServer
 from core import echo_console
 from excepthooks import ExceptHooks
 #   UserMessage
@@ -25,6 +24,8 @@ from usermessage_c import Color
 from usermessage_c import UserMessage
 #   Filters
 from filters.recipients import RecipientFilter
+#   Players
+from players.helpers import language_from_index
 #   Translations
 from translations.strings import TranslationStrings
 
@@ -559,8 +560,7 @@ class BaseMessage(dict):
             for index in recipient:
 
                 # Add the current index
-                languages[EngineServer.get_client_convar_value(index,
-                    'cl_language')].add(index)
+                languages[language_from_index(index)].add(index)
 
             # Loop through all languages
             for language, users in languages.items():
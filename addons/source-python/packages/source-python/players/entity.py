@@ -5,11 +5,13 @@
 # =============================================================================
 # Source.Python Imports
 from conversions_c import playerinfo_from_index
-from engine_c import EngineServer
+from entity_c import Edict
+from player_c import PlayerInfo
 #   Entities
 from entities.entity import BaseEntity
 #   Players
 from players.helpers import address_from_playerinfo
+from players.helpers import cl_language_from_index
 from players.helpers import uniqueid_from_playerinfo
 from players.weapons import _PlayerWeapons
 
@@ -29,12 +31,15 @@ __all__ = [
 class PlayerEntity(BaseEntity, _PlayerWeapons):
     '''Class used to interact directly with players'''
 
+    # Store the types of the objects yielded by the instances property
+    _instance_types = (PlayerInfo, Edict)
+
     def __new__(cls, index):
         '''Override the __new__ method to set the
             "entities" attribute and set the PlayerInfo'''
 
         # Get the "self" object using the super class' __new__
-        self = super(PlayerEntity, cls).__new__(cls, index)
+        self = super(PlayerEntity, cls).__new__(cls, index, 'player')
 
         # Set the player's info attribute
         self._info = playerinfo_from_index(self.index)
@@ -45,9 +50,6 @@ class PlayerEntity(BaseEntity, _PlayerWeapons):
             raise ValueError(
                 'Invalid IPlayerInfo instance for index "{0}"'.format(index))
 
-        # Set the entities attribute
-        self._entities = frozenset(['entity', 'player'])
-
         # Return the instance
         return self
 
@@ -85,7 +87,7 @@ class PlayerEntity(BaseEntity, _PlayerWeapons):
     @property
     def language(self):
         '''Returns the player's language'''
-        return EngineServer.get_client_convar_value(self.index, 'cl_language')
+        return cl_language_from_index(self.index)
 
     @property
     def uniqueid(self):
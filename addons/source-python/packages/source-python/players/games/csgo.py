@@ -4,10 +4,8 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python Imports
-from entity_c import EntityGenerator
 #   Entities
-from entities.entity import BaseEntity
-from entities.helpers import index_from_edict
+from entities.registry import EntityRegistry
 
 
 # =============================================================================
@@ -99,20 +97,6 @@ class _GameWeapons(object):
     def has_c4(self):
         '''Returns whether or not the player is carrying C4'''
 
-        # Loop through all c4 entities on the server
-        for edict in EntityGenerator('weapon_c4'):
-
-            # Get the entity's index
-            index = index_from_edict(edict)
-
-            # Get the entity's BaseEntity instance
-            entity = BaseEntity(index)
-
-            # Is the entity's "owner" the player?
-            if entity.owner == self.handle.to_int():
-
-                # Return True
-                return True
-
-        # If no c4 is owned by the player, return False
-        return False
+        # Return whether any c4 entity's "owner" is the player
+        return bool(EntityRegistry.get_owned_indexes(
+            self.handle.to_int(), 'weapon_c4'))
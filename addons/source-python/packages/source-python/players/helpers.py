@@ -5,7 +5,15 @@
 # =============================================================================
 # Source.Python Imports
 from conversions_c import *
+from conversions_c import index_from_userid as _index_from_userid
 from engine_c import EngineServer
+from listener_c import ClientDisconnectListenerManager
+from listener_c import ClientPutInServerListenerManager
+from listener_c import ClientSettingsChangedListenerManager
+from listener_c import NetworkidValidatedListenerManager
+from player_c import PlayerGenerator
+#   Translations
+from translations.manager import LanguageManager
 
 
 # =============================================================================
@@ -19,6 +27,7 @@ __all__ = [
     'basehandle_from_playerinfo',
     'basehandle_from_pointer',
     'basehandle_from_userid',
+    'cl_language_from_index',
     'edict_from_basehandle',
     'edict_from_index',
     'edict_from_inthandle',
@@ -40,6 +49,7 @@ __all__ = [
     'inthandle_from_playerinfo',
     'inthandle_from_pointer',
     'inthandle_from_userid',
+    'language_from_index',
     'playerinfo_from_basehandle',
     'playerinfo_from_edict',
     'playerinfo_from_index',
@@ -68,74 +78,109 @@ __all__ = [
 def index_from_steamid(steamid):
     '''Returns an index from the given SteamID'''
 
-    # Loop through all players on the server
-    for player in CPlayerGenerator():
+    # Get the indexes of the players with the given SteamID
+    indexes = PlayerLookups.steamids.get(steamid)
 
-        # Is the current player's SteamID the same as the one given?
-        if player.get_networkid_string() == steamid:
+    # Is no player using the given SteamID?
+    if not indexes:
 
-            # Return the index of the current player
-            return index_from_playerinfo(player)
+        # Raise an error
+        raise ValueError('Invalid SteamID "{0}"'.format(steamid))
 
-    # If no player found with a matching SteamID, raise an error
-    raise ValueError('Invalid SteamID "{0}"'.format(steamid))
+    # Return the lowest index, as players were originally searched in order
+    return min(indexes)
 
 
 def index_from_uniqueid(uniqueid):
     '''Returns an index from the given UniqueID'''
 
-    # Loop through all players on the server
-    for player in CPlayerGenerator():
+    # Get the indexes of the players with the given UniqueID
+    indexes = PlayerLookups.uniqueids.get(uniqueid)
 
-        # Is the current player's UniqueID the same as the one given?
-        if uniqueid_from_playerinfo(player) == uniqueid:
+    # Is no player using the given UniqueID?
+    if not indexes:
 
-            # Return the index of the current player
-            return index_from_playerinfo(player)
+        # Raise an error
+        raise ValueError('Invalid UniqueID "{0}"'.format(uniqueid))
 
-    # If no player found with a matching UniqueID, raise an error
-    raise ValueError('Invalid UniqueID "{0}"'.format(uniqueid))
+    # Return the lowest index, as players were originally searched in order
+    return min(indexes)
 
 
 def index_from_name(name):
     '''Returns an index from the given player name'''
 
-    # Loop through all players on the server
-    for player in CPlayerGenerator():
+    # Get the indexes of the players with the given name
+    indexes = PlayerLookups.names.get(name)
 
-        # Is the current player's name the same as the one given?
-        if player.get_name() == name:
+    # Is no player using the given name?
+    if not indexes:
 
-            # Return the index of the current player
-            return index_from_playerinfo(player)
+        # Raise an error
+        raise ValueError('Invalid name "{0}"'.format(name))
 
-    # If no player found with a matching name, raise an error
-    raise ValueError('Invalid name "{0}"'.format(name))
+    # Return the lowest index, as players were originally searched in order
+    return min(indexes)
+
+
+def index_from_userid(userid):
+    '''Returns an index from the given userid'''
+
+    # Get the indexes of the players with the given userid
+    indexes = PlayerLookups.userids.get(userid)
+
+    # Is no player using the given userid?
+    if not indexes:
+
+        # Let the engine find the player (or raise the error)
+        return _index_from_userid(userid)
+
+    # Return the player's index
+    return min(indexes)
 
 
 def uniqueid_from_playerinfo(player):
     '''Returns the UniqueID for the given player'''
 
+    # Get the player's index
+    index = index_from_playerinfo(player)
+
+    # Get the player's cached UniqueID
+    uniqueid = ClientIdentities.uniqueids.get(index)
+
+    # Has the UniqueID already been stored?
+    if uniqueid is not None:
+
+        # Return the cached UniqueID
+        return uniqueid
+
     # Is the player a Bot?
     if player.is_fake_client():
 
-        # Return the bot's UniqueID
-        return 'BOT_{0}'.format(player.get_name())
+        # Get the bot's UniqueID
+        uniqueid = 'BOT_{0}'.format(player.get_name())
+
+    # Is the player not a Bot?
+    else:
+
+        # Get the player's SteamID
+        uniqueid = player.get_networkid_string()
 
-    # Get the player's SteamID
-    steamid = player.get_networkid_string()
+        # Is this a Lan SteamID?
+        if 'LAN' in uniqueid:
 
-    # Is this a Lan SteamID?
-    if 'LAN' in steamid:
+            # Get the player's IP address
+            address = address_from_playerinfo(player)
 
-        # Get the player's IP address
-        address = address_from_player(player)
+            # Get the Lan player's ID
+            uniqueid = 'LAN_{0}'.format(
+                '_'.join(address.split(':')[0].split('.')))
 
-        # Return the Lan player's ID
-        return 'LAN_{0}'.format('_'.join(address.split(':')[0].split('.')))
+    # Store the player's UniqueID
+    ClientIdentities.uniqueids[index] = uniqueid
 
-    # Return the player's SteamID
-    return steamid
+    # Return the player's UniqueID
+    return uniqueid
 
 
 def address_from_playerinfo(player):
@@ -144,8 +189,269 @@ def address_from_playerinfo(player):
     # Get the player's index
     index = index_from_playerinfo(player)
 
+    # Get the player's cached IP address
+    address = ClientIdentities.addresses.get(index)
+
+    # Has the IP address already been stored?
+    if address is not None:
+
+        # Return the cached IP address
+        return address
+
     # Get the player's NetInfo instance
     netinfo = EngineServer.get_player_net_info(index)
 
+    # Store the player's IP Address
+    address = ClientIdentities.addresses[index] = netinfo.get_address()
+
     # Return the player's IP Address
-    return netinfo.get_address()
+    return address
+
+
+def cl_language_from_index(index):
+    '''Returns the cl_language value of the given player'''
+
+    # Get the player's cached cl_language value
+    cl_language = ClientIdentities.cl_languages.get(index)
+
+    # Has the cl_language value not been stored?
+    if cl_language is None:
+
+        # Get the player's cl_language value
+        cl_language = EngineServer.get_client_convar_value(
+            index, 'cl_language')
+
+        # Store the player's cl_language value
+        ClientIdentities.cl_languages[index] = cl_language
+
+    # Return the player's cl_language value
+    return cl_language
+
+
+def language_from_index(index):
+    '''Returns the language shortname of the given player'''
+
+    # Get the player's cached languages
+    languages = ClientIdentities.languages
+
+    # Has the language been stored?
+    if index in languages:
+
+        # Get the player's language
+        language = languages[index]
+
+    # Has the language not been stored?
+    else:
+
+        # Store the shortname of the player's language.
+        # None is stored for languages that are not known.
+        language = languages[index] = LanguageManager.get_language(
+            cl_language_from_index(index))
+
+    # Is the language not known?
+    if language is None:
+
+        # Return the server's current default language
+        return LanguageManager.default
+
+    # Return the player's language
+    return language
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _ClientIdentities(object):
+    '''Class used to store the UniqueID, IP address, and language of
+        each client by index for as long as the client is connected, so
+        they are not retrieved again every time they are needed.  A
+        client's values are also removed when its settings change, since
+        that is when its language or (for bots) name can change.'''
+
+    def __init__(self):
+        '''Creates the dictionaries'''
+
+        # Store the UniqueID, IP address, cl_language value,
+        # and language shortname of each client
+        self.uniqueids = dict()
+        self.addresses = dict()
+        self.cl_languages = dict()
+        self.languages = dict()
+
+    def remove_client(self, index):
+        '''Removes the stored values of the given client'''
+        self.uniqueids.pop(index, None)
+        self.addresses.pop(index, None)
+        self.cl_languages.pop(index, None)
+        self.languages.pop(index, None)
+
+    def clear(self):
+        '''Removes the stored values of all clients'''
+        self.uniqueids.clear()
+        self.addresses.clear()
+        self.cl_languages.clear()
+        self.languages.clear()
+
+    def _client_changed(self, edict, *args):
+        '''Removes the values of the client that changed'''
+        self.remove_client(index_from_edict(edict))
+
+    def _client_put_in_server(self, edict, name):
+        '''Stores the language of the client that was put in the server'''
+
+        # Get the client's index
+        index = index_from_edict(edict)
+
+        # Remove any values of the slot's previous client
+        self.remove_client(index)
+
+        # Store the client's language
+        language_from_index(index)
+
+    def _client_settings_changed(self, edict):
+        '''Removes the values of the client and stores its new language'''
+
+        # Remove the client's values
+        self._client_changed(edict)
+
+        # Store the client's language
+        language_from_index(index_from_edict(edict))
+
+    def _networkid_validated(self, name, networkid):
+        '''Removes the UniqueID of the validated client'''
+
+        # Loop through all players
+        for player in PlayerGenerator():
+
+            # Is this the validated client?
+            if player.get_name() == name:
+
+                # Remove the client's UniqueID
+                self.uniqueids.pop(index_from_playerinfo(player), None)
+
+# Get the _ClientIdentities instance
+ClientIdentities = _ClientIdentities()
+
+# Register the listeners before any listener that uses the stored values
+ClientPutInServerListenerManager.register_listener(
+    ClientIdentities._client_put_in_server)
+ClientSettingsChangedListenerManager.register_listener(
+    ClientIdentities._client_settings_changed)
+NetworkidValidatedListenerManager.register_listener(
+    ClientIdentities._networkid_validated)
+ClientDisconnectListenerManager.register_listener(
+    ClientIdentities._client_changed)
+
+
+class _PlayerLookups(object):
+    '''Class used to store the indexes of the players by their SteamID,
+        UniqueID, name, and userid.  The tables are updated by the client
+        listeners, so finding a player's index does not need to loop
+        through all players.  Each table stores a set of indexes, since
+        players can share a name or a LAN SteamID.'''
+
+    def __init__(self):
+        '''Creates the lookup tables'''
+
+        # Store the identifiers of each player by their index
+        self._identifiers = dict()
+
+        # Store the indexes by each identifier
+        self.steamids = dict()
+        self.uniqueids = dict()
+        self.names = dict()
+        self.userids = dict()
+
+    def add_player(self, index):
+        '''Adds the player's current identifiers to the tables'''
+
+        # Remove the player's old identifiers
+        self.remove_player(index)
+
+        # Get the player's PlayerInfo instance
+        player = playerinfo_from_index(index)
+
+        # Get the player's identifiers
+        identifiers = self._identifiers[index] = (
+            player.get_networkid_string(),
+            uniqueid_from_playerinfo(player),
+            player.get_name(),
+            player.get_userid(),
+        )
+
+        # Add the index to each of the identifiers
+        for table, identifier in zip(self._get_tables(), identifiers):
+            table.setdefault(identifier, set()).add(index)
+
+    def remove_player(self, index):
+        '''Removes the player's identifiers from the tables'''
+
+        # Get the player's identifiers
+        identifiers = self._identifiers.pop(index, None)
+
+        # Was the player not added?
+        if identifiers is None:
+            return
+
+        # Loop through all identifiers
+        for table, identifier in zip(self._get_tables(), identifiers):
+
+            # Remove the index from the identifier
+            indexes = table[identifier]
+            indexes.discard(index)
+
+            # Are there no more players with the identifier?
+            if not indexes:
+
+                # Remove the identifier
+                del table[identifier]
+
+    def _get_tables(self):
+        '''Returns the tables in the order of the stored identifiers'''
+        return self.steamids, self.uniqueids, self.names, self.userids
+
+    def _client_put_in_server(self, edict, name):
+        '''Adds the player that was put in the server'''
+        self.add_player(index_from_edict(edict))
+
+    def _client_settings_changed(self, edict):
+        '''Updates the player's name in case it changed'''
+
+        # Get the player's index
+        index = index_from_edict(edict)
+
+        # Has the player been added?
+        if index in self._identifiers:
+
+            # Update the player's identifiers
+            self.add_player(index)
+
+    def _networkid_validated(self, name, networkid):
+        '''Updates the SteamID and UniqueID of the validated player'''
+
+        # Loop through the players with the given name
+        for index in list(self.names.get(name, ())):
+
+            # Update the player's identifiers
+            self.add_player(index)
+
+    def _client_disconnect(self, edict):
+        '''Removes the disconnected player'''
+        self.remove_player(index_from_edict(edict))
+
+# Get the _PlayerLookups instance
+PlayerLookups = _PlayerLookups()
+
+# Add all current players
+for _player in PlayerGenerator():
+    PlayerLookups.add_player(index_from_playerinfo(_player))
+
+# Register the listeners
+ClientPutInServerListenerManager.register_listener(
+    PlayerLookups._client_put_in_server)
+ClientSettingsChangedListenerManager.register_listener(
+    PlayerLookups._client_settings_changed)
+NetworkidValidatedListenerManager.register_listener(
+    PlayerLookups._networkid_validated)
+ClientDisconnectListenerManager.register_listener(
+    PlayerLookups._client_disconnect)
@@ -0,0 +1,277 @@
+# ../players/snapshot.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Array
+from array import array
+
+# Source.Python Imports
+from entity_c import PropSet
+from globals_c import GlobalVars
+#   Entities
+from entities.helpers import edict_from_index
+from entities.properties import EntityProperties
+#   Filters
+from filters.players import PlayerIter
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+# Add all the global variables to __all__
+__all__ = [
+    'PlayerSnapshot',
+]
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the array typecode and number of values for each property type
+_property_formats = {
+    'int': ('i', 1),
+    'float': ('f', 1),
+    'vector': ('f', 3),
+}
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class PlayerSnapshot(dict):
+    '''Dictionary that stores the values of the given player properties
+        of all players as memoryviews.  Each call to update fills the
+        same contiguous arrays, so the memoryviews can be used with any
+        code that supports the buffer protocol.  Int properties are
+        int32 arrays, float properties are float32 arrays, and vector
+        properties are float32 arrays with the shape (players, 3).'''
+
+    def __init__(self, *names, is_filters=[], not_filters=[]):
+        '''Stores the properties to read and the filters to use'''
+
+        # Call the super class' __init__
+        super(PlayerSnapshot, self).__init__()
+
+        # Get the player's properties
+        properties = EntityProperties.get_game_attributes(
+            frozenset(['entity', 'player']))
+
+        # Store the names of the properties
+        self._names = names
+
+        # Store the network property names and formats
+        self._prop_names = list()
+        self._formats = list()
+
+        # Loop through all given names
+        for name in names:
+
+            # Is the name not a player property?
+            if not name in properties:
+
+                # Raise an error
+                raise KeyError(
+                    'Invalid player property "{0}" given.'.format(name))
+
+            # Get the property
+            prop = properties[name]
+
+            # Is the property's type not supported?
+            if not prop.type in _property_formats:
+
+                # Raise an error
+                raise ValueError(
+                    'Player property "{0}" of type "{1}" can not be '.format(
+                        name, prop.type) + 'stored in an array.')
+
+            # Store the network property name and format
+            self._prop_names.append(prop.prop)
+            self._formats.append(_property_formats[prop.type])
+
+        # Store the filters for the PlayerIter
+        self._is_filters = is_filters
+        self._not_filters = not_filters
+
+        # Store a PropSet for each server class the players use
+        self._prop_sets = list()
+
+        # Create the arrays
+        self._create_arrays(GlobalVars.max_clients)
+
+        # Store the number of players in the snapshot
+        self._count = 0
+        self._store_views(0)
+
+    def update(self):
+        '''Reads the properties of all players and
+            returns the number of players in the snapshot'''
+
+        # Get the indexes of all players
+        indexes = list(
+            PlayerIter(self._is_filters, self._not_filters, 'index'))
+
+        # Get the number of players
+        count = self._count = len(indexes)
+
+        # Get the values of all players.  This is done before using
+        # the arrays, since resolving the properties can replace them.
+        rows = self._get_values(indexes)
+
+        # Are there more players than the arrays can store?
+        if count > len(self._indexes):
+
+            # Create larger arrays
+            self._create_arrays(count)
+
+        # Store the indexes
+        self._indexes[:count] = array('i', indexes)
+
+        # Loop through all properties
+        for position, name in enumerate(self._names):
+
+            # Get the property's values and format
+            prop_values = [row[position] for row in rows]
+            typecode, width = self._formats[position]
+
+            # Is the property a vector?
+            if width == 3:
+
+                # Get the vector's values as a flat list
+                prop_values = [
+                    value for vector in prop_values
+                    for value in (vector.x, vector.y, vector.z)]
+
+            # Store the values in the property's array
+            self._arrays[name][:count * width] = array(typecode, prop_values)
+
+        # Store the memoryviews for the current number of players
+        self._store_views(count)
+
+        # Return the number of players
+        return count
+
+    def _get_values(self, indexes):
+        '''Returns a list with a tuple of the values of each index'''
+
+        # Get the positions of the indexes that use each PropSet
+        positions = dict()
+        for position, index in enumerate(indexes):
+            positions.setdefault(self._get_prop_set(
+                edict_from_index(index)), list()).append(position)
+
+        # Get the number of properties
+        total = len(self._names)
+
+        # Create a list to store the values of each index
+        rows = [None] * len(indexes)
+
+        # Loop through the PropSets that are used
+        for number, prop_set_positions in positions.items():
+
+            # Get the values of the indexes that use the PropSet
+            values = self._prop_sets[number].get_values_for_indexes(
+                [indexes[position] for position in prop_set_positions])
+
+            # Store the values of each index
+            for row, position in enumerate(prop_set_positions):
+                rows[position] = values[row * total:(row + 1) * total]
+
+        # Return the values
+        return rows
+
+    def _get_prop_set(self, edict):
+        '''Returns the number of the PropSet for the edict's server class,
+            resolving the properties the first time the class is used'''
+
+        # Loop through all PropSets
+        for number, prop_set in enumerate(self._prop_sets):
+
+            # Was the PropSet resolved for the edict's server class?
+            if prop_set.is_valid_for(edict):
+                return number
+
+        # Resolve the properties for the edict's server class
+        prop_set = PropSet(edict, self._prop_names)
+
+        # Get the formats of the resolved properties
+        formats = list()
+        for name, prop_type in zip(self._names, prop_set.types):
+
+            # Is the property's type not supported?
+            if not prop_type in _property_formats:
+
+                # Raise an error
+                raise TypeError(
+                    'Player property "{0}" of type "{1}" can not be '.format(
+                        name, prop_type) + 'stored in an array.')
+
+            # Add the property's format
+            formats.append(_property_formats[prop_type])
+
+        # Is this the first PropSet?
+        if not self._prop_sets:
+
+            # Do the resolved formats differ from the ini types?
+            if formats != self._formats:
+
+                # Use the resolved formats
+                self._formats = formats
+                self._create_arrays(len(self._indexes))
+
+        # Do the formats differ from another server class' formats?
+        elif formats != self._formats:
+
+            # Raise an error
+            raise TypeError(
+                'Player properties have different types for ' +
+                'different server classes.')
+
+        # Store the PropSet
+        self._prop_sets.append(prop_set)
+
+        # Return the PropSet's number
+        return len(self._prop_sets) - 1
+
+    def _create_arrays(self, size):
+        '''Creates the arrays to store the given number of players'''
+
+        # Create the array for the indexes
+        self._indexes = array('i', [0]) * size
+
+        # Create the array for each property
+        self._arrays = dict()
+        for name, (typecode, width) in zip(self._names, self._formats):
+            self._arrays[name] = array(typecode, [0]) * (size * width)
+
+    def _store_views(self, count):
+        '''Stores the memoryviews for the given number of players'''
+
+        # Store the memoryview of the indexes
+        self._indexes_view = memoryview(self._indexes)[:count]
+
+        # Loop through all properties
+        for name, (typecode, width) in zip(self._names, self._formats):
+
+            # Get the memoryview of the property's values
+            view = memoryview(self._arrays[name])[:count * width]
+
+            # Is the property a vector (empty views can not have a shape)?
+            if width == 3 and count:
+
+                # Get the memoryview with the shape (players, 3)
+                view = view.cast('B').cast(typecode, (count, 3))
+
+            # Store the memoryview
+            self[name] = view
+
+    @property
+    def count(self):
+        '''Returns the number of players in the snapshot'''
+        return self._count
+
+    @property
+    def indexes(self):
+        '''Returns a memoryview of the indexes of the players'''
+        return self._indexes_view
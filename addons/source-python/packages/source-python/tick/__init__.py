@@ -35,7 +35,7 @@ class Tick(AutoUnload):
         '''Store the callback and register the tick listener'''
 
         # Log the Tick.__init__ message
-        TickLogger.log_info('Tick.__init__ <{0}>'.format(callback))
+        TickLogger.log_info('Tick.__init__ <%s>', callback)
 
         # Is the callback callable?
         if not callable(callback):
@@ -64,8 +64,7 @@ class Tick(AutoUnload):
 
         # Log the unregistering
         TickLogger.log_info(
-            'Tick._unload_instance - Unregistering '
-            '<{0}>'.format(self.callback))
+            'Tick._unload_instance - Unregistering <%s>', self.callback)
 
         # Unregister the tick listener
         TickListenerManager.unregister_listener(self.callback)
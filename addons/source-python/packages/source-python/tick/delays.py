@@ -4,10 +4,17 @@
 # >> IMPORTS
 # =============================================================================
 # Python Imports
+#   Heapq
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+#   Itertools
+from itertools import count
 #   Time
 import time
 
 # Source.Python Imports
+from globals_c import GlobalVars
 from listener_c import TickListenerManager
 from excepthooks import ExceptHooks
 #   Tick
@@ -19,6 +26,7 @@ from tick import TickLogger
 # =============================================================================
 # Add all the global variables to __all__
 __all__ = [
+    'FrameDelays',
     'TickDelays',
 ]
 
@@ -42,8 +50,8 @@ class _Delay(object):
 
         # Log the init message
         TickDelaysLogger.log_info(
-            '_Delay.__init__ <{0}> <{1}> <{2}> <{3}>'.format(
-                seconds, callback, args, kwargs))
+            '_Delay.__init__ <%s> <%s> <%s> <%s>',
+            seconds, callback, args, kwargs)
 
         # Store the time to execute the callback
         self.exec_time = time.time() + seconds
@@ -53,13 +61,17 @@ class _Delay(object):
         self.args = args
         self.kwargs = kwargs
 
+        # Store whether the delay is waiting to be called.
+        # Cancelled delays stay in their scheduler and are skipped.
+        self._scheduled = False
+
     def __call__(self):
         '''Calls the delay with the proper arguments and keywords'''
 
         # Log the call message
         TickDelaysLogger.log_info(
-            '_Delay.__call__ - Try to call - <{0}> <{1}> <{2}>'.format(
-                self.callback, self.args, self.kwargs))
+            '_Delay.__call__ - Try to call - <%s> <%s> <%s>',
+            self.callback, self.args, self.kwargs)
 
         # Use try/except in case an error is encountered
         try:
@@ -73,34 +85,100 @@ class _Delay(object):
             # Print the exception to the console
             ExceptHooks.print_exception()
 
+    @property
+    def cancelled(self):
+        '''Returns whether the delay was cancelled or already called'''
+        return not self._scheduled
 
-class _Times(list):
-    '''List class used to store delays to be called'''
 
-    def call_delays(self):
-        '''Call the delays in the list'''
+class _FrameDelay(_Delay):
+    '''Delay object that is called on a server tick instead of a time'''
 
-        # Loop through the delays in the list
-        for item in self:
+    def __init__(self, seconds, callback, *args, **kwargs):
+        '''Called when an instance is instantiated'''
 
-            # Call the delay
-            item()
+        # Call the base __init__ to store the time, callback, and arguments
+        super(_FrameDelay, self).__init__(seconds, callback, *args, **kwargs)
 
+        # Get the number of ticks to wait (always at least one)
+        ticks = max(1, int(round(seconds / GlobalVars.interval_per_tick)))
 
-class _TickDelays(dict):
-    '''Class used to store delays to be called by a tick listener'''
+        # Store the tick to execute the callback on
+        self.exec_tick = GlobalVars.tick_count + ticks
+
+
+class _TickDelays(list):
+    '''Binary heap used to store delays to be called by a tick listener'''
 
     def __init__(self):
         '''Called when the class is first instantiated'''
 
-        # Store an ordered list to sort delays
-        self._order = list()
+        # Store a counter to keep delays with the same time in order
+        self._sequence = count()
 
-    def __missing__(self, item):
-        '''Called when first adding a time to the dictionary'''
+        # Store the number of delays that have not been cancelled
+        self._live = 0
 
-        # Log the missing message
-        TickDelaysLogger.log_info('TickDelays.__missing__ <{0}>'.format(item))
+        # Store the per-tick budget values (0 means no limit)
+        self._budget_time = 0
+        self._budget_callbacks = 0
+
+        # Store the budget counters
+        self._deferred_callbacks = 0
+        self._budget_overruns = 0
+
+        # Store the time of the last tick that ran out of budget
+        self._deferred_until = 0
+
+    def set_budget(self, microseconds=0, callbacks=0):
+        '''Sets the maximum time and number of callbacks used per tick.
+            Delays left over are called on the next tick in order.'''
+
+        # Log the set_budget message
+        TickDelaysLogger.log_info(
+            'TickDelays.set_budget <%s> <%s>', microseconds, callbacks)
+
+        # Were negative values given?
+        if microseconds < 0 or callbacks < 0:
+
+            # Raise an error
+            raise ValueError('Budget values cannot be negative')
+
+        # Store the budget values
+        self._budget_time = microseconds / 1000000
+        self._budget_callbacks = callbacks
+
+    def reset_counters(self):
+        '''Resets the deferred callbacks and budget overruns counters'''
+        self._deferred_callbacks = 0
+        self._budget_overruns = 0
+
+    @property
+    def deferred_callbacks(self):
+        '''Returns the number of callbacks called on a later
+            tick than they were due because of the budget'''
+        return self._deferred_callbacks
+
+    @property
+    def budget_overruns(self):
+        '''Returns the number of ticks that ran out of budget'''
+        return self._budget_overruns
+
+    def delay(self, seconds, callback, *args, **kwargs):
+        '''Method used to create a delay'''
+
+        # Get the _Delay instance for the given arguments
+        delay_object = _Delay(seconds, callback, *args, **kwargs)
+
+        # Add the _Delay instance to the heap
+        self._push(delay_object)
+
+        # Return the object
+        return delay_object
+
+    def _push(self, delay_object):
+        '''Adds the given delay to the heap using its exec_time.
+            Also used to re-add a delay after it has been called.'''
 
         # Is the tick listener registered?
         if not self:
@@ -111,61 +189,179 @@ class _TickDelays(dict):
             # Register the tick listener
             TickListenerManager.register_listener(self._tick)
 
-        # Add the item to the dictionary as a _Times instance
-        self[item] = _Times()
+        # Add the delay to the heap
+        delay_object._scheduled = True
+        heappush(self, (
+            delay_object.exec_time, next(self._sequence), delay_object))
+        self._live += 1
 
-        # Add the time to the ordered list
-        self._order.append(item)
+    def _tick(self):
+        '''Called every tick when the listener is registered'''
 
-        # Sort the ordered list
-        self._order.sort()
+        # Get the current time
+        current_time = time.time()
 
-        # Return the item's instance
-        return self[item]
+        # Get the maximum number of callbacks for this tick
+        budget_callbacks = self._budget_callbacks
+
+        # Get the time this tick's budget runs out, if there is one
+        deadline = (
+            time.perf_counter() + self._budget_time
+            if self._budget_time else None)
+
+        # Store the number of callbacks called this tick
+        called = 0
+
+        # Loop while the earliest delay should be called
+        while self and self[0][0] <= current_time:
+
+            # Was the earliest delay cancelled?
+            if not self[0][2]._scheduled:
+
+                # Drop the cancelled delay
+                heappop(self)
+                continue
+
+            # Has the tick's budget run out?
+            # At least one delay is always called, so the heap moves on.
+            if called and (
+                    called == budget_callbacks or
+                    deadline is not None and time.perf_counter() >= deadline):
+
+                # Log the overrun message
+                TickDelaysLogger.log_info(
+                    'TickDelays._tick - Budget ran out after '
+                    '<%s> callbacks', called)
+
+                # Leave the remaining delays in the heap for the next tick
+                self._budget_overruns += 1
+                self._deferred_until = current_time
+                break
+
+            # Remove the earliest delay from the heap
+            delay_object = heappop(self)[2]
+            delay_object._scheduled = False
+            self._live -= 1
+
+            # Was the delay due on a tick that ran out of budget?
+            if delay_object.exec_time <= self._deferred_until:
+                self._deferred_callbacks += 1
+
+            # Call the delay
+            delay_object()
+            called += 1
+
+        # Are there no more delays waiting to be called?
+        if not self._live:
+
+            # Log the tick listener unregistering message
+            TickDelaysLogger.log_info(
+                'TickDelays._tick - Unregistering Tick Listener')
+
+            # Remove any cancelled delays and unregister the tick listener
+            self._clear()
+
+    def cancel_delay(self, delay_object):
+        '''Method used to cancel a delay'''
+
+        # Log the canceling message
+        TickDelaysLogger.log_info(
+            'TickDelays.cancel_delay <%s>', delay_object)
+
+        # Is the given argument a _Delay object?
+        if not isinstance(delay_object, _Delay):
+
+            # If not, raise an error
+            raise TypeError(
+                'TickDelays.cancel_delay requires a _Delay instance.')
+
+        # Is the given _Delay object no longer waiting to be called?
+        if not delay_object._scheduled:
+
+            # If not, raise an error
+            raise KeyError('Object is no longer registered.')
+
+        # Mark the delay as cancelled.  It is skipped once it is reached.
+        delay_object._scheduled = False
+        self._live -= 1
+
+        # Are there any remaining delays?
+        if not self._live:
 
-    def __iter__(self):
-        '''Override __iter__ to loop through the ordered list'''
+            # Log the tick listener unregistering message
+            TickDelaysLogger.log_info(
+                'TickDelays.cancel_delay - Unregistering Tick Listener')
 
-        # Loop through each item in the ordered list
-        for item in self._order:
+            # Remove the cancelled delays and unregister the listener
+            self._clear()
 
-            # Yield the item
-            yield item
+        # Are most of the delays in the heap cancelled?
+        elif len(self) > 2 * self._live + 64:
 
-    def __delitem__(self, item):
-        '''Override __delitem__ to call the delays and
-            remove the time from the ordered list'''
+            # Remove the cancelled delays from the heap
+            self[:] = [item for item in self if item[2]._scheduled]
+            heapify(self)
 
-        # Log the delitem message
-        TickDelaysLogger.log_info('TickDelays.__delitem__ <{0}>'.format(item))
+    def _clear(self):
+        '''Removes all delays and unregisters the tick listener'''
 
-        # Is the item in the dictionary?
-        if not item in self:
+        # Remove the delays
+        del self[:]
+
+        # Unregister the tick listener
+        TickListenerManager.unregister_listener(self._tick)
+
+# Get the _TickDelays instance
+TickDelays = _TickDelays()
+
+
+class _FrameDelays(dict):
+    '''Class used to store delays in one bucket per server tick'''
+
+    def __init__(self):
+        '''Called when the class is first instantiated'''
+
+        # Store a heap of the ticks that have delays
+        self._ticks = list()
+
+        # Store the number of delays that have not been cancelled
+        self._live = 0
+
+    def __missing__(self, item):
+        '''Called when first adding a tick to the dictionary'''
+
+        # Log the missing message
+        TickDelaysLogger.log_info('FrameDelays.__missing__ <%s>', item)
 
-            # Log the not in self message
+        # Is the tick listener registered?
+        if not self:
+
+            # Log the tick listener registration message
             TickDelaysLogger.log_info(
-                'TickDelays.__delitem__ - Item not in dictionary')
+                'FrameDelays - Registering Tick Listener')
 
-            # If not, simply return
-            return
+            # Register the tick listener
+            TickListenerManager.register_listener(self._tick)
 
-        # Call all delays for the given item
-        self[item].call_delays()
+        # Add the item to the dictionary as a list of delays
+        value = self[item] = list()
 
-        # Remove the item from the ordered list
-        self._order.remove(item)
+        # Add the tick to the heap
+        heappush(self._ticks, item)
 
-        # Remove the item from the dictionary
-        super(_TickDelays, self).__delitem__(item)
+        # Return the item's instance
+        return value
 
     def delay(self, seconds, callback, *args, **kwargs):
-        '''Method used to create a delay'''
+        '''Method used to create a delay rounded to the nearest tick'''
 
-        # Get the _Delay instance for the given arguments
-        delay_object = _Delay(seconds, callback, *args, **kwargs)
+        # Get the _FrameDelay instance for the given arguments
+        delay_object = _FrameDelay(seconds, callback, *args, **kwargs)
 
-        # Add the _Delay instance to the dictionary using its execution time
-        self[delay_object.exec_time].append(delay_object)
+        # Add the _FrameDelay instance to its tick's bucket
+        self[delay_object.exec_tick].append(delay_object)
+        delay_object._scheduled = True
+        self._live += 1
 
         # Return the object
         return delay_object
@@ -173,79 +369,80 @@ class _TickDelays(dict):
     def _tick(self):
         '''Called every tick when the listener is registered'''
 
-        # Get the current time
-        current_time = time.time()
+        # Get the current tick
+        current_tick = GlobalVars.tick_count
 
-        # Loop through each item in the ordered list
-        for item in self:
+        # Get the heap of ticks
+        ticks = self._ticks
 
-            # Should the delays be called?
-            if item > current_time:
+        # Loop while the earliest tick should be called
+        while ticks and ticks[0] <= current_tick:
 
-                # If not, no need to continue looping
-                break
+            # Loop through the delays in the tick's bucket
+            for delay_object in self.pop(heappop(ticks)):
 
-            # Remove the item from the dictionary
-            del self[item]
+                # Was the delay cancelled?
+                if not delay_object._scheduled:
+                    continue
 
-        # Is the dictionary now empty?
-        if not self:
+                # Call the delay
+                delay_object._scheduled = False
+                self._live -= 1
+                delay_object()
+
+        # Are there no more delays waiting to be called?
+        if not self._live:
 
             # Log the tick listener unregistering message
             TickDelaysLogger.log_info(
-                'TickDelays._tick - Unregistering Tick Listener')
+                'FrameDelays._tick - Unregistering Tick Listener')
 
-            # Unregister the tick listener
-            TickListenerManager.unregister_listener(self._tick)
+            # Remove any cancelled delays and unregister the tick listener
+            self._clear()
 
     def cancel_delay(self, delay_object):
         '''Method used to cancel a delay'''
 
         # Log the canceling message
         TickDelaysLogger.log_info(
-            'TickDelays.cancel_delay <{0}>'.format(delay_object))
+            'FrameDelays.cancel_delay <%s>', delay_object)
 
-        # Is the given argument a _Delay object?
-        if not isinstance(delay_object, _Delay):
+        # Is the given argument a _FrameDelay object?
+        if not isinstance(delay_object, _FrameDelay):
 
             # If not, raise an error
             raise TypeError(
-                'TickDelays.cancel_delay requires a _Delay instance.')
+                'FrameDelays.cancel_delay requires a _FrameDelay instance.')
 
-        # Is the given _Delay object's time no longer in the dictionary?
-        if not delay_object.exec_time in self:
+        # Is the given _FrameDelay object no longer waiting to be called?
+        if not delay_object._scheduled:
 
             # If not, raise an error
             raise KeyError('Object is no longer registered.')
 
-        # Log the removing from list message
-        TickDelaysLogger.log_info(
-            'TickDelays.cancel_delay - Removing from '
-            '<{0}>'.format(delay_object.exec_time))
-
-        # Remove the delay from its time
-        self[delay_object.exec_time].remove(delay_object)
+        # Mark the delay as cancelled.  It is skipped once its tick is reached.
+        delay_object._scheduled = False
+        self._live -= 1
 
-        # Does the delay's time have any remaining objects?
-        if not self[delay_object.exec_time]:
+        # Are there any remaining delays?
+        if not self._live:
 
-            # Log the deletion of the time from the dictionary message
+            # Log the tick listener unregistering message
             TickDelaysLogger.log_info(
-                'TickDelays.cancel_delay - Removing <{0}> '
-                'from dictionary'.format(delay_object.exec_time))
+                'FrameDelays.cancel_delay - Unregistering Tick Listener')
 
-            # If not, remove the delay's time from the dictionary
-            del self[delay_object.exec_time]
+            # Remove the cancelled delays and unregister the listener
+            self._clear()
 
-        # Are there any remaining delays?
-        if not self:
+    def _clear(self):
+        '''Removes all delays and unregisters the tick listener'''
 
-            # Log the tick listener unregistering message
-            TickDelaysLogger.log_info(
-                'TickDelays.cancel_delay - Unregistering Tick Listener')
+        # Remove the buckets and their ticks
+        self.clear()
+        del self._ticks[:]
 
-            # Unregister the listener
-            TickListenerManager.unregister_listener(self._tick)
+        # Unregister the tick listener
+        TickListenerManager.unregister_listener(self._tick)
 
-# Get the _TickDelays instance
-TickDelays = _TickDelays()
+# Get the _FrameDelays instance
+FrameDelays = _FrameDelays()
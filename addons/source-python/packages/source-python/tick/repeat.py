@@ -4,13 +4,18 @@
 # >> IMPORTS
 # =============================================================================
 # Python Imports
+#   Collections
+from collections import OrderedDict
 #   Time
 import time
 
 # Source.Python Imports
+from globals_c import GlobalVars
 from core import AutoUnload
+from excepthooks import ExceptHooks
 #   Tick
 from tick import TickLogger
+from tick.delays import _Delay
 from tick.delays import TickDelays
 
 
@@ -20,6 +25,7 @@ from tick.delays import TickDelays
 # Add all the global variables to __all__
 __all__ = [
     'Repeat',
+    'RepeatCatchUp',
     'RepeatStatus',
 ]
 
@@ -39,6 +45,194 @@ class RepeatStatus(object):
     STOPPED, RUNNING, PAUSED = range(1, 4)
 
 
+class RepeatCatchUp(object):
+    '''Class used to store what a fixed-schedule repeat
+        does when it falls more than one loop behind'''
+    SKIP, BURST, STRETCH = range(1, 4)
+
+
+class _RepeatTimer(OrderedDict):
+    '''Class used to call all fixed-schedule repeats that
+        share the same interval and next loop time'''
+
+    def __init__(self, interval, catch_up, start_time):
+        '''Stores the schedule and creates the timer's delay'''
+
+        # Call the base __init__
+        super(_RepeatTimer, self).__init__()
+
+        # Store the schedule values
+        self.interval = interval
+        self.catch_up = catch_up
+        self._start_time = start_time
+        self._loops = 1
+
+        # Store the key the timer is registered with
+        self._key = None
+
+        # Create the one delay used for every loop and add it
+        self._delay = _Delay(0, self._execute)
+        self._delay.exec_time = self.next_time
+        TickDelays._push(self._delay)
+
+    @property
+    def next_time(self):
+        '''Returns the time of the timer's next loop'''
+        return self._start_time + self._loops * self.interval
+
+    def remove(self, repeat):
+        '''Removes the repeat and stops the timer if it is no longer used'''
+
+        # Remove the repeat
+        del self[repeat]
+
+        # Are there any remaining repeats?
+        if self:
+            return
+
+        # Remove the timer from the registry
+        _RepeatTimers.discard(self)
+
+        # Is the timer's delay waiting to be called?
+        if not self._delay.cancelled:
+
+            # Cancel the delay
+            TickDelays.cancel_delay(self._delay)
+
+    def _execute(self):
+        '''Calls all repeats and adds the delay for the next loop'''
+
+        # Remove the timer from the registry, since its key will change
+        _RepeatTimers.discard(self)
+
+        # Move to the next loop before calling the repeats, so that
+        # repeats that pause or read next_time get the next loop's time
+        self._loops += 1
+
+        # Call the repeats for the current loop
+        self._call_repeats()
+
+        # Get the current time
+        current_time = time.time()
+
+        # Is the timer more than one loop behind?
+        if self.next_time <= current_time:
+
+            # Should the missed loops be called now?
+            if self.catch_up == RepeatCatchUp.BURST:
+
+                # Call the repeats until the timer has caught up
+                while self and self.next_time <= current_time:
+                    self._loops += 1
+                    self._call_repeats()
+
+            # Should the missed loops be skipped?
+            elif self.catch_up == RepeatCatchUp.SKIP:
+
+                # Move to the first loop after the current time
+                self._loops = int(
+                    (current_time - self._start_time) / self.interval) + 1
+
+            # Should the schedule start over from the current time?
+            else:
+
+                # Restart the schedule from the current time
+                self._start_time = current_time
+                self._loops = 1
+
+        # Are there no more repeats?
+        if not self:
+            return
+
+        # Add the delay back for the next loop
+        self._delay.exec_time = self.next_time
+        TickDelays._push(self._delay)
+
+        # Add the timer back to the registry
+        _RepeatTimers.add(self)
+
+    def _call_repeats(self):
+        '''Calls each repeat registered to the timer'''
+
+        # Loop through a copy, since repeats can stop during the loop
+        for repeat in list(self):
+
+            # Was the repeat removed during the loop?
+            if repeat._timer is not self:
+                continue
+
+            # Use try/except so that one repeat cannot stop the others
+            try:
+
+                # Call the repeat
+                repeat._execute()
+
+            # Was an error encountered?
+            except:
+
+                # Print the exception to the console
+                ExceptHooks.print_exception()
+
+
+class _RepeatTimerRegistry(dict):
+    '''Dictionary used to find the timer a new fixed-schedule repeat joins'''
+
+    @staticmethod
+    def get_key(interval, catch_up, next_time):
+        '''Returns the key for the given interval, catch up
+            value, and next loop time (rounded to the tick)'''
+        return (
+            interval, catch_up, int(next_time / GlobalVars.interval_per_tick))
+
+    def add(self, timer):
+        '''Registers the timer for its next loop if no other timer has'''
+
+        # Get the timer's key
+        key = self.get_key(timer.interval, timer.catch_up, timer.next_time)
+
+        # Does a timer already use the key?
+        if key in self:
+            return
+
+        # Register the timer
+        timer._key = key
+        self[key] = timer
+
+    def discard(self, timer):
+        '''Unregisters the given timer if it is registered'''
+
+        # Is the timer registered?
+        if self.get(timer._key) is timer:
+
+            # Unregister the timer
+            del self[timer._key]
+
+        # Reset the timer's key
+        timer._key = None
+
+    def subscribe(self, repeat, interval, catch_up, first_time):
+        '''Adds the repeat to a timer whose next loop is at the given time'''
+
+        # Get the timer for the interval and time
+        timer = self.get(self.get_key(interval, catch_up, first_time))
+
+        # Is there no timer yet?
+        if timer is None:
+
+            # Create and register the timer
+            timer = _RepeatTimer(interval, catch_up, first_time - interval)
+            self.add(timer)
+
+        # Add the repeat to the timer
+        timer[repeat] = None
+
+        # Return the timer
+        return timer
+
+# Get the _RepeatTimerRegistry instance
+_RepeatTimers = _RepeatTimerRegistry()
+
+
 class Repeat(AutoUnload):
     '''Class used to create and call repeats'''
 
@@ -52,8 +246,8 @@ class Repeat(AutoUnload):
 
         # Log the __init__ message
         TickRepeatLogger.log_info(
-            'Repeat.__init__: <{0}> <{1}> <{2}>'.format(
-                self.callback, self.args, self.kwargs))
+            'Repeat.__init__: <%s> <%s> <%s>',
+            self.callback, self.args, self.kwargs)
 
         # Set up private attributes
         self._interval = 0
@@ -62,12 +256,22 @@ class Repeat(AutoUnload):
         self._adjusted = 0
         self._status = RepeatStatus.STOPPED
 
-    def start(self, interval, limit):
-        '''Starts the repeat loop'''
+        # Set up the fixed-schedule attributes
+        self._fixed = False
+        self._catch_up = RepeatCatchUp.BURST
+        self._timer = None
+
+    def start(
+            self, interval, limit, fixed=False,
+            catch_up=RepeatCatchUp.BURST):
+        '''Starts the repeat loop.  If fixed is True, loop n is called at
+            start + n * interval using a timer shared with other repeats,
+            and catch_up decides what happens after falling behind'''
 
         # Log the start message
         TickRepeatLogger.log_info(
-            'Repeat.start: <{0}> <{1}>'.format(interval, limit))
+            'Repeat.start: <%s> <%s> <%s> <%s>',
+            interval, limit, fixed, catch_up)
 
         # Is the repeat already running?
         if self._status == RepeatStatus.RUNNING:
@@ -88,13 +292,15 @@ class Repeat(AutoUnload):
         # Set the given attributes
         self._interval = interval
         self._limit = limit
+        self._fixed = fixed
+        self._catch_up = catch_up
 
         # Reset base counting attributes
         self._count = 0
         self._adjusted = 0
 
         # Start the delay
-        self._delay = TickDelays.delay(self._interval, self._execute)
+        self._schedule(self._interval)
 
     def stop(self):
         '''Stops the repeat loop'''
@@ -119,7 +325,7 @@ class Repeat(AutoUnload):
         self._status = RepeatStatus.STOPPED
 
         # Cancel the delay
-        TickDelays.cancel_delay(self._delay)
+        self._unschedule()
 
     def restart(self):
         '''Restarts the repeat'''
@@ -131,7 +337,7 @@ class Repeat(AutoUnload):
         self.stop()
 
         # Start the repeat
-        self.start(self._interval, self._limit)
+        self.start(self._interval, self._limit, self._fixed, self._catch_up)
 
     def pause(self):
         '''Pauses the repeat.  Pausing allows the repeat to be resumed'''
@@ -156,10 +362,10 @@ class Repeat(AutoUnload):
         self._status = RepeatStatus.PAUSED
 
         # Set the remaining time in the current loop
-        self._loop_time = self._delay.exec_time - time.time()
+        self._loop_time = self.next_time - time.time()
 
         # Cancel the delay
-        TickDelays.cancel_delay(self._delay)
+        self._unschedule()
 
     def resume(self):
         '''Resume the repeat.  Can only resume if in paused status'''
@@ -180,8 +386,11 @@ class Repeat(AutoUnload):
         TickRepeatLogger.log_info(
             'Repeat.resume - RepeatStatus.PAUSED - Resuming Repeat')
 
+        # Set the status to running
+        self._status = RepeatStatus.RUNNING
+
         # Start the delay
-        self._delay = TickDelays.delay(self._loop_time, self._execute)
+        self._schedule(self._loop_time)
 
     def extend(self, adjustment):
         '''Adds to the number of loops to be made'''
@@ -247,10 +456,13 @@ class Repeat(AutoUnload):
 
                 # Log continuing the loop
                 TickRepeatLogger.log_info(
-                    'Repeat._execute - Remaining - {0}'.format(self.remaining))
+                    'Repeat._execute - Remaining - %s', self.remaining)
 
-            # Call the delay again
-            self._delay = TickDelays.delay(self._interval, self._execute)
+            # Is the repeat using a delay for each loop?
+            if not self._fixed:
+
+                # Call the delay again
+                self._delay = TickDelays.delay(self._interval, self._execute)
 
         # Are no more loops to be made?
         else:
@@ -261,9 +473,56 @@ class Repeat(AutoUnload):
             # Set the status to stopped
             self._status = RepeatStatus.STOPPED
 
+            # Is the repeat registered to a timer?
+            if self._fixed:
+
+                # Remove the repeat from its timer
+                self._unschedule()
+
         # Call the repeat's callback
         self.callback(*self.args, **self.kwargs)
 
+    def _schedule(self, seconds):
+        '''Schedules the next loop to be called in the given seconds'''
+
+        # Is the repeat not on a fixed schedule?
+        if not self._fixed:
+
+            # Add a delay for the loop
+            self._delay = TickDelays.delay(seconds, self._execute)
+            return
+
+        # Add the repeat to the timer for its first loop
+        self._timer = _RepeatTimers.subscribe(
+            self, self._interval, self._catch_up, time.time() + seconds)
+
+    def _unschedule(self):
+        '''Cancels the next loop'''
+
+        # Is the repeat not on a fixed schedule?
+        if not self._fixed:
+
+            # Cancel the delay
+            TickDelays.cancel_delay(self._delay)
+            return
+
+        # Remove the repeat from its timer
+        self._timer.remove(self)
+        self._timer = None
+
+    @property
+    def next_time(self):
+        '''Returns the time the next loop will be called at'''
+
+        # Is the repeat on a fixed schedule?
+        if self._fixed:
+
+            # Return the timer's next loop time
+            return self._timer.next_time
+
+        # Return the delay's time
+        return self._delay.exec_time
+
     @property
     def remaining(self):
         '''Returns the remaining number of loops in the repeat'''
@@ -37,6 +37,7 @@
 #include "boost/algorithm/string.hpp"
 #include "boost/foreach.hpp"
 #include "utility/wrap_macros.h"
+#include "modules/conversions/conversions_wrap.h"
 
 //-----------------------------------------------------------------------------
 // If these aren't defined, we get linker errors about CBaseEdict.
@@ -296,4 +297,250 @@ CSendProp::CSendProp( edict_t* edict, const char* prop_name )
 inline SendPropType CSendProp::GetType()
 {
 	return m_send_prop->GetType();
-}
\ No newline at end of file
+}
+//-----------------------------------------------------------------------------
+// Helper functions to read and write a resolved SendProp's value.
+//-----------------------------------------------------------------------------
+static bool IsSupportedSendPropType( SendPropType type )
+{
+	return type == DPT_Int || type == DPT_Float || type == DPT_String || type == DPT_Vector;
+}
+
+static object ReadSendPropValue( CBaseEntity* base_entity, unsigned int offset, SendPropType type )
+{
+	char* data = (char *) base_entity + offset;
+	switch( type )
+	{
+		case DPT_Int:
+			return object(*(int *) data);
+		case DPT_Float:
+			return object(*(float *) data);
+		case DPT_String:
+			return str((const char *) data);
+		case DPT_Vector:
+			return object(*(Vector *) data);
+		default:
+			return object();
+	}
+}
+
+static void WriteSendPropValue( CBaseEntity* base_entity, unsigned int offset, SendPropType type, object value )
+{
+	char* data = (char *) base_entity + offset;
+	switch( type )
+	{
+		case DPT_Int:
+			*(int *) data = extract<int>(value);
+			break;
+		case DPT_Float:
+			*(float *) data = extract<float>(value);
+			break;
+		case DPT_String:
+			V_strncpy(data, extract<const char*>(value), DT_MAX_STRING_BUFFERSIZE);
+			break;
+		case DPT_Vector:
+			*(Vector *) data = extract<Vector>(value);
+			break;
+		default:
+			break;
+	}
+}
+
+//-----------------------------------------------------------------------------
+// CSendPropHandle code.
+//-----------------------------------------------------------------------------
+CSendPropHandle::CSendPropHandle( const char* prop_name ) :
+	m_prop_name(prop_name)
+{
+}
+
+const char* CSendPropHandle::GetName()
+{
+	return m_prop_name.c_str();
+}
+
+const CResolvedSendProp& CSendPropHandle::Resolve( edict_t* edict )
+{
+	if( !edict || edict->IsFree() )
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "edict was not valid!");
+
+	ServerClass* server_class = edict->GetNetworkable()->GetServerClass();
+
+	// Has the prop already been resolved for the server class?
+	for( unsigned int i = 0; i < m_resolved.size(); i++ )
+	{
+		if( m_resolved[i].server_class == server_class )
+			return m_resolved[i];
+	}
+
+	// Resolve the prop for the server class
+	CSendProp prop = CSendProp(edict, m_prop_name.c_str());
+
+	CResolvedSendProp resolved;
+	resolved.server_class = server_class;
+	resolved.offset = prop.GetOffset();
+	resolved.type = prop.GetType();
+
+	if( !IsSupportedSendPropType(resolved.type) )
+	{
+		std::string szMessage = "prop_name '";
+		szMessage += m_prop_name;
+		szMessage += "' is not an int, float, string or vector.";
+		BOOST_RAISE_EXCEPTION(PyExc_TypeError, szMessage.c_str());
+	}
+
+	m_resolved.push_back(resolved);
+	return m_resolved.back();
+}
+
+object CSendPropHandle::GetValue( edict_t* edict )
+{
+	const CResolvedSendProp& resolved = Resolve(edict);
+	return ReadSendPropValue(edict->GetUnknown()->GetBaseEntity(), resolved.offset, resolved.type);
+}
+
+void CSendPropHandle::SetValue( edict_t* edict, object value )
+{
+	const CResolvedSendProp& resolved = Resolve(edict);
+	WriteSendPropValue(edict->GetUnknown()->GetBaseEntity(), resolved.offset, resolved.type, value);
+
+	// Force a network update.
+	edict->StateChanged();
+}
+
+//-----------------------------------------------------------------------------
+// CSendPropSet code.
+//-----------------------------------------------------------------------------
+CSendPropSet::CSendPropSet( edict_t* edict, object prop_names )
+{
+	if( !edict || edict->IsFree() )
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "edict was not valid!");
+
+	// Store the server class to validate the edicts the set is used with
+	m_server_class = edict->GetNetworkable()->GetServerClass();
+
+	// Resolve each prop once
+	int iCount = len(prop_names);
+	for( int i = 0; i < iCount; i++ )
+	{
+		const char* prop_name = extract<const char*>(prop_names[i]);
+		CSendProp prop = CSendProp(edict, prop_name);
+
+		SendPropType type = prop.GetType();
+		if( !IsSupportedSendPropType(type) )
+		{
+			std::string szMessage = "prop_name '";
+			szMessage += prop_name;
+			szMessage += "' is not an int, float, string or vector.";
+			BOOST_RAISE_EXCEPTION(PyExc_TypeError, szMessage.c_str());
+		}
+
+		m_offsets.push_back(prop.GetOffset());
+		m_types.push_back(type);
+	}
+}
+
+int CSendPropSet::GetCount()
+{
+	return m_offsets.size();
+}
+
+tuple CSendPropSet::GetTypes()
+{
+	list types;
+	for( unsigned int i = 0; i < m_types.size(); i++ )
+	{
+		switch( m_types[i] )
+		{
+			case DPT_Int:
+				types.append("int");
+				break;
+			case DPT_Float:
+				types.append("float");
+				break;
+			case DPT_String:
+				types.append("string");
+				break;
+			case DPT_Vector:
+				types.append("vector");
+				break;
+		}
+	}
+	return tuple(types);
+}
+
+bool CSendPropSet::IsValidFor( edict_t* edict )
+{
+	return edict && !edict->IsFree() && edict->GetNetworkable()->GetServerClass() == m_server_class;
+}
+
+CBaseEntity* CSendPropSet::GetBaseEntity( edict_t* edict )
+{
+	if( !edict || edict->IsFree() )
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "edict was not valid!");
+
+	// The offsets are only valid for the server class they were resolved for
+	if( edict->GetNetworkable()->GetServerClass() != m_server_class )
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "edict's server class does not match the prop set's server class.");
+
+	return edict->GetUnknown()->GetBaseEntity();
+}
+
+void CSendPropSet::ReadValues( CBaseEntity* base_entity, list& values )
+{
+	for( unsigned int i = 0; i < m_offsets.size(); i++ )
+	{
+		values.append(ReadSendPropValue(base_entity, m_offsets[i], m_types[i]));
+	}
+}
+
+void CSendPropSet::WriteValues( edict_t* edict, CBaseEntity* base_entity, object values, int start )
+{
+	for( unsigned int i = 0; i < m_offsets.size(); i++ )
+	{
+		WriteSendPropValue(base_entity, m_offsets[i], m_types[i], values[start + i]);
+	}
+
+	// Force a single network update for all props.
+	edict->StateChanged();
+}
+
+tuple CSendPropSet::GetValues( edict_t* edict )
+{
+	list values;
+	ReadValues(GetBaseEntity(edict), values);
+	return tuple(values);
+}
+
+void CSendPropSet::SetValues( edict_t* edict, object values )
+{
+	if( len(values) != (int) m_offsets.size() )
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "The number of values does not match the number of props.");
+
+	WriteValues(edict, GetBaseEntity(edict), values, 0);
+}
+
+tuple CSendPropSet::GetValuesForIndexes( object indexes )
+{
+	list values;
+	int iCount = len(indexes);
+	for( int i = 0; i < iCount; i++ )
+	{
+		edict_t* edict = EdictFromIndex(extract<unsigned int>(indexes[i]));
+		ReadValues(GetBaseEntity(edict), values);
+	}
+	return tuple(values);
+}
+
+void CSendPropSet::SetValuesForIndexes( object indexes, object values )
+{
+	int iCount = len(indexes);
+	if( len(values) != iCount * (int) m_offsets.size() )
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "The number of values does not match the number of props times the number of indexes.");
+
+	for( int i = 0; i < iCount; i++ )
+	{
+		edict_t* edict = EdictFromIndex(extract<unsigned int>(indexes[i]));
+		WriteValues(edict, GetBaseEntity(edict), values, i * m_offsets.size());
+	}
+}
@@ -32,7 +32,10 @@
 #include "edict.h"
 #include "server_class.h"
 #include <cstdint>
+#include <string>
+#include <vector>
 #include "toolframework/itoolentity.h"
+#include "utility/wrap_macros.h"
 
 // Externals
 extern IServerTools* servertools;
@@ -85,6 +88,9 @@ public:
 
 	SendPropType GetType();
 
+	unsigned int GetOffset()
+	{ return m_prop_offset; }
+
 	template<class T>
 	T Get()
 	{ return *(T *) ((char *) m_base_entity + m_prop_offset); }
@@ -127,4 +133,80 @@ inline void CSendProp::Set(const char* szValue)
 	m_edict->StateChanged();
 }
 
+//-----------------------------------------------------------------------------
+// A SendProp's offset and type for one server class.
+//-----------------------------------------------------------------------------
+struct CResolvedSendProp
+{
+	ServerClass*	server_class;
+	unsigned int	offset;
+	SendPropType	type;
+};
+
+//-----------------------------------------------------------------------------
+// Handle to a SendProp that is resolved once per server class, so that
+// reads and writes go straight to the entity's memory without any lookups.
+//-----------------------------------------------------------------------------
+class CSendPropHandle
+{
+public:
+	CSendPropHandle( const char* prop_name );
+
+	const char* GetName();
+
+	object GetValue( edict_t* edict );
+	void   SetValue( edict_t* edict, object value );
+
+private:
+	// Returns the prop's offset and type for the edict's server class.
+	const CResolvedSendProp& Resolve( edict_t* edict );
+
+private:
+	// Name of the prop.
+	std::string						m_prop_name;
+
+	// Offset and type for each server class the prop was used with.
+	std::vector<CResolvedSendProp>	m_resolved;
+};
+
+//-----------------------------------------------------------------------------
+// Set of SendProps that are resolved once to their offsets and types, so
+// that all of them can be read or written for many entities in one call.
+//-----------------------------------------------------------------------------
+class CSendPropSet
+{
+public:
+	CSendPropSet( edict_t* edict, object prop_names );
+
+	int    GetCount();
+	tuple  GetTypes();
+	bool   IsValidFor( edict_t* edict );
+
+	tuple  GetValues( edict_t* edict );
+	void   SetValues( edict_t* edict, object values );
+
+	tuple  GetValuesForIndexes( object indexes );
+	void   SetValuesForIndexes( object indexes, object values );
+
+private:
+	// Returns the base entity of the edict after validating its server class.
+	CBaseEntity* GetBaseEntity( edict_t* edict );
+
+	// Adds the values of all props of the base entity to the list.
+	void ReadValues( CBaseEntity* base_entity, list& values );
+
+	// Writes the values starting at the given index to the base entity.
+	void WriteValues( edict_t* edict, CBaseEntity* base_entity, object values, int start );
+
+private:
+	// The server class the props were resolved for.
+	ServerClass*				m_server_class;
+
+	// Offset of each prop from the beginning of the entity.
+	std::vector<unsigned int>	m_offsets;
+
+	// Type of each prop.
+	std::vector<SendPropType>	m_types;
+};
+
 #endif
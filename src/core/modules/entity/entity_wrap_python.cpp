@@ -47,6 +47,8 @@ void export_server_unknown();
 void export_server_entity();
 void export_server_networkable();
 void export_edict();
+void export_send_prop_handle();
+void export_send_prop_set();
 void export_entity_generator();
 
 DECLARE_SP_MODULE(entity_c)
@@ -57,6 +59,8 @@ DECLARE_SP_MODULE(entity_c)
 	export_server_entity();
 	export_server_networkable();
 	export_edict();
+	export_send_prop_handle();
+	export_send_prop_set();
 	export_entity_generator();
 }
 
@@ -479,6 +483,86 @@ void export_edict()
 	;
 }
 
+//-----------------------------------------------------------------------------
+// Exports CSendPropHandle.
+//-----------------------------------------------------------------------------
+void export_send_prop_handle()
+{
+	class_<CSendPropHandle, boost::noncopyable>("PropHandle", init<const char*>(
+			args("prop_name"),
+			"Stores a network property that is resolved once for each server class."
+		))
+
+		.add_property("name",
+			&CSendPropHandle::GetName,
+			"Returns the name of the network property."
+		)
+
+		.def("get_value",
+			&CSendPropHandle::GetValue,
+			"Returns the value of the network property for the given edict.",
+			args("edict")
+		)
+
+		.def("set_value",
+			&CSendPropHandle::SetValue,
+			"Sets the network property of the given edict to the given value.",
+			args("edict", "value")
+		)
+	;
+}
+
+//-----------------------------------------------------------------------------
+// Exports CSendPropSet.
+//-----------------------------------------------------------------------------
+void export_send_prop_set()
+{
+	class_<CSendPropSet>("PropSet", init<edict_t*, object>(
+			args("edict", "prop_names"),
+			"Resolves the given network properties of the edict's server class once."
+		))
+
+		.def("__len__",
+			&CSendPropSet::GetCount
+		)
+
+		.add_property("types",
+			&CSendPropSet::GetTypes,
+			"Returns a tuple with the type name of each resolved property."
+		)
+
+		.def("is_valid_for",
+			&CSendPropSet::IsValidFor,
+			"Returns whether the edict uses the server class the properties were resolved for.",
+			args("edict")
+		)
+
+		.def("get_values",
+			&CSendPropSet::GetValues,
+			"Returns a tuple with the values of all properties of the edict.",
+			args("edict")
+		)
+
+		.def("set_values",
+			&CSendPropSet::SetValues,
+			"Sets all properties of the edict to the given values.",
+			args("edict", "values")
+		)
+
+		.def("get_values_for_indexes",
+			&CSendPropSet::GetValuesForIndexes,
+			"Returns a flat tuple with the values of all properties of each index.",
+			args("indexes")
+		)
+
+		.def("set_values_for_indexes",
+			&CSendPropSet::SetValuesForIndexes,
+			"Sets all properties of each index to the values in the given flat sequence.",
+			args("indexes", "values")
+		)
+	;
+}
+
 //-----------------------------------------------------------------------------
 // Exports CEntityGenerator.
 //-----------------------------------------------------------------------------
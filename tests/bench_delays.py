@@ -0,0 +1,94 @@
+# ../tests/bench_delays.py
+
+'''Benchmarks scheduling, cancelling, and calling queued TickDelays.
+    Half of the delays are cancelled in random order and the rest are
+    called over 100 ticks.  Each operation should cost O(log n), so
+    the time per delay should barely grow with the number of delays.
+
+    Run with: python -m tests.bench_delays'''
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Random
+import random
+#   Time
+from time import perf_counter
+#   Unittest
+from unittest import mock
+
+# Test Imports
+from tests import fakes
+
+from listener_c import TickListenerManager
+from tick.delays import TickDelays
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the numbers of delays to benchmark
+COUNTS = (10000, 100000)
+
+# Store the number of ticks used to call the delays
+TICKS = 100
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _callback():
+    '''Callback used by the delays'''
+
+
+def benchmark(total):
+    '''Prints the time taken to schedule, cancel, and call the delays'''
+
+    # Get the same delay times and cancel order for each run
+    generator = random.Random(total)
+    seconds = [generator.uniform(0, TICKS) for x in range(total)]
+
+    # Start a controllable clock
+    current_time = [1000.0]
+    with mock.patch('time.time', lambda: current_time[0]):
+
+        # Schedule the delays
+        start = perf_counter()
+        delays = [TickDelays.delay(delay, _callback) for delay in seconds]
+        scheduled = perf_counter()
+
+        # Cancel half of the delays in random order
+        generator.shuffle(delays)
+        for delay in delays[:total // 2]:
+            TickDelays.cancel_delay(delay)
+        cancelled = perf_counter()
+
+        # Call the remaining delays over the ticks
+        for tick in range(TICKS + 1):
+            current_time[0] += 1
+            TickListenerManager.notify()
+        called = perf_counter()
+
+    # Were all delays called?
+    assert not TickDelays and all(delay.cancelled for delay in delays)
+
+    # Print the time taken per delay for each operation
+    print('{0:>8} delays: {1:>6.2f} us schedule, {2:>6.2f} us cancel, '
+          '{3:>6.2f} us call'.format(
+            total, (scheduled - start) / total * 1e6,
+            (cancelled - scheduled) / (total // 2) * 1e6,
+            (called - cancelled) / (total - total // 2) * 1e6))
+
+
+def main():
+    '''Runs all benchmarks'''
+
+    # Loop through the numbers of delays to test
+    for total in COUNTS:
+
+        # Run the benchmark
+        benchmark(total)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+# ../tests/bench_entity_attributes.py
+
+'''Benchmarks reading entity attributes through the descriptors of the
+    classes created by EntityClasses, compared with finding them through
+    BaseEntity.__getattr__, which is how all attributes used to be read.
+
+    Run with: python -m tests.bench_entity_attributes'''
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Timeit
+from timeit import timeit
+
+# Test Imports
+from tests import fakes
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the number of times each attribute is read
+ITERATIONS = 200000
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Edict(object):
+    '''Fake edict that stores its property and keyvalue values'''
+
+    def __init__(self):
+        '''Stores the values'''
+        self.values = {'m_iHealth': 100, 'm_lifeState': 0}
+        self.key_values = {'targetname': 'player'}
+
+    def is_free(self):
+        '''Returns whether the edict is free'''
+        return False
+
+    def get_key_value_string(self, name):
+        '''Returns the keyvalue's value'''
+        return self.key_values[name]
+
+    def set_key_value_string(self, name, value):
+        '''Sets the keyvalue's value'''
+        self.key_values[name] = value
+
+
+class Pointer(object):
+    '''Fake pointer with no values'''
+
+
+class PropHandle(object):
+    '''Fake PropHandle that reads the edict's values'''
+
+    def __init__(self, prop_name):
+        '''Stores the property name'''
+        self.name = prop_name
+
+    def get_value(self, edict):
+        '''Returns the property's value'''
+        return edict.values[self.name]
+
+    def set_value(self, edict, value):
+        '''Sets the property's value'''
+        edict.values[self.name] = value
+
+
+class Property(dict):
+    '''Fake entity property with its PropHandle'''
+
+    def __init__(self, prop_name, **values):
+        '''Stores the PropHandle and the property's values'''
+        super(Property, self).__init__(values)
+        self.handle = PropHandle(prop_name)
+
+
+class GameAttributes(object):
+    '''Fake attribute store that returns the same attributes
+        for all sets of entities'''
+
+    def __init__(self, attributes):
+        '''Stores the attributes'''
+        self.attributes = attributes
+
+    def get_game_attributes(self, entities):
+        '''Returns the attributes'''
+        return self.attributes
+
+
+# Add the compiled and ini based modules needed by entities.entity
+EDICT = Edict()
+fakes.install_module(
+    'conversions_c', edict_from_index=lambda index: EDICT,
+    index_from_edict=lambda edict: 1)
+fakes.install_module('entity_c', Edict=Edict, PropHandle=PropHandle)
+fakes.install_module('memory_c', Pointer=Pointer)
+fakes.install_module(
+    'entities.attributes', EntityAttributes=type(
+        'EntityAttributes', (object, ), {'generation': 0}))
+fakes.install_module('entities.properties', EntityProperties=GameAttributes({
+    'health': Property('m_iHealth'),
+    'isdead': Property('m_lifeState', **{'True': 1, 'False': 0}),
+}))
+fakes.install_module('entities.keyvalues', EntityKeyValues=GameAttributes({
+    'targetname': 'string',
+}))
+fakes.install_module(
+    'entities.offsets', EntityOffsets=GameAttributes(dict()))
+fakes.install_module(
+    'entities.functions', EntityFunctions=GameAttributes(dict()))
+
+from entities.entity import BaseEntity
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def main():
+    '''Runs all benchmarks'''
+
+    # Get the entity
+    entity = BaseEntity(1)
+
+    # Get the old attribute lookup
+    getattr_path = BaseEntity.__getattr__
+
+    # Print the header
+    print('Reading each attribute {0} times:'.format(ITERATIONS))
+
+    # Loop through the attributes to test
+    for attribute in ('health', 'isdead', 'targetname'):
+
+        # Are the values not the same for both paths?
+        assert getattr(entity, attribute) == getattr_path(entity, attribute)
+
+        # Time both paths
+        descriptor_time = timeit(
+            lambda: getattr(entity, attribute), number=ITERATIONS)
+        getattr_time = timeit(
+            lambda: getattr_path(entity, attribute), number=ITERATIONS)
+
+        # Print the results
+        print('{0:<12}{1:>8.3f} s descriptor{2:>8.3f} s __getattr__'
+              '{3:>7.1f}x faster'.format(
+                attribute, descriptor_time, getattr_time,
+                getattr_time / descriptor_time))
+
+if __name__ == '__main__':
+    main()
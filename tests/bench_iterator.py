@@ -0,0 +1,183 @@
+# ../tests/bench_iterator.py
+
+'''Benchmarks iterating 64 fake players with three filters.  The compiled
+    filters are compared with looking up each filter in the registry for
+    every item, which is how the iterators used to validate items.
+
+    Run with: python -m tests.bench_iterator'''
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Timeit
+from timeit import timeit
+
+# Test Imports
+from tests import fakes
+
+from filters.iterator import _IterObject
+from filters.registry import _FilterRegistry
+from filters.registry import _ReturnTypeRegistry
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the number of times each iterator is used
+ITERATIONS = 10000
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Player(object):
+    '''Fake player with the values the filters use'''
+
+    def __init__(self, index):
+        '''Stores the player's values'''
+        self.index = index
+        self.alive = index % 4 != 0
+        self.bot = index % 3 == 0
+        self.team = 2 + index % 2
+
+
+class CountingFilterRegistry(_FilterRegistry):
+    '''Filter registry that counts its lookups'''
+
+    lookups = 0
+
+    def __getitem__(self, item):
+        '''Counts the lookup'''
+        CountingFilterRegistry.lookups += 1
+        return super(CountingFilterRegistry, self).__getitem__(item)
+
+
+class CountingReturnTypeRegistry(_ReturnTypeRegistry):
+    '''Return type registry that counts its lookups'''
+
+    lookups = 0
+
+    def __getitem__(self, item):
+        '''Counts the lookup'''
+        CountingReturnTypeRegistry.lookups += 1
+        return super(CountingReturnTypeRegistry, self).__getitem__(item)
+
+
+class Manager(object):
+    '''Fake filter manager with the fake players' filters'''
+
+    _filters = CountingFilterRegistry('FakePlayerIter')
+    _return_types = CountingReturnTypeRegistry('FakePlayerIter')
+
+
+# Register the filters and return types
+Manager._filters.register('alive', lambda player: player.alive)
+Manager._filters.register('bot', lambda player: player.bot)
+Manager._filters.register('ct', lambda player: player.team == 3)
+Manager._return_types.register('index', lambda player: player.index)
+Manager._return_types.register('team', lambda player: player.team)
+
+# Create the fake players
+PLAYERS = [Player(index) for index in range(1, 65)]
+
+
+class FakePlayerIter(_IterObject):
+    '''Iterates over the fake players with compiled filters'''
+
+    manager = Manager
+
+    @staticmethod
+    def iterator():
+        '''Returns an iterator of the fake players'''
+        return iter(PLAYERS)
+
+
+class LookupPlayerIter(FakePlayerIter):
+    '''Iterates over the fake players, looking up
+        the filters and return types for each item'''
+
+    def __iter__(self):
+        '''Yields the return types of the valid items'''
+
+        # Loop through the items
+        for item in self.iterator():
+
+            # Is the current item yieldable?
+            if not self._lookup_is_valid(item):
+                continue
+
+            # Are the return types a string?
+            if isinstance(self._return_types, str):
+
+                # Yield the return type for the current item
+                yield self.manager._return_types[self._return_types](item)
+
+            # Otherwise
+            else:
+
+                # Yield the list of return types for the current item
+                yield [
+                    self.manager._return_types[return_type](item)
+                    for return_type in self._return_types]
+
+    def _lookup_is_valid(self, item):
+        '''Returns whether the item passes the filters'''
+
+        # Loop through all "is" filters
+        for filter_name in self._is_filters:
+
+            # Does the item not pass this filter?
+            if not self.manager._filters[filter_name](item):
+                return False
+
+        # Loop through all "not" filters
+        for filter_name in self._not_filters:
+
+            # Does the item pass this filter?
+            if self.manager._filters[filter_name](item):
+                return False
+
+        # Return True, since all checks passed
+        return True
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def benchmark(iterator_class, return_types):
+    '''Prints the time and registry lookups of iterating the players'''
+
+    # Create the iterator
+    iterator = iterator_class(['alive', 'ct'], 'bot', return_types)
+
+    # Reset the lookup counts
+    CountingFilterRegistry.lookups = 0
+    CountingReturnTypeRegistry.lookups = 0
+
+    # Time iterating the players
+    seconds = timeit(lambda: list(iterator), number=ITERATIONS)
+
+    # Print the results
+    print('{0:<18}{1:<20}{2:>8.3f} s{3:>10} lookups per iteration'.format(
+        iterator_class.__name__, repr(return_types), seconds, (
+            CountingFilterRegistry.lookups +
+            CountingReturnTypeRegistry.lookups) // ITERATIONS))
+
+
+def main():
+    '''Runs all benchmarks'''
+
+    # Print the header
+    print('Iterating {0} players {1} times with three filters:'.format(
+        len(PLAYERS), ITERATIONS))
+
+    # Loop through the return types to test
+    for return_types in ('index', ['index', 'team']):
+
+        # Run the benchmarks
+        benchmark(LookupPlayerIter, return_types)
+        benchmark(FakePlayerIter, return_types)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+# ../tests/fakes.py
+
+'''Installs pure Python replacements for the compiled Source.Python
+    modules, so that the Python packages can be imported without a
+    running server.  Import this module before any Source.Python module.'''
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   OS
+import os
+#   Sys
+import sys
+#   Types
+from types import ModuleType
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Get the path to ../addons/source-python/packages
+_packages_path = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'addons', 'source-python', 'packages')
+
+# Add the Source.Python and site packages to the path
+for _directory in ('source-python', 'site-packages'):
+    _path = os.path.join(_packages_path, _directory)
+    if not _path in sys.path:
+        sys.path.insert(0, _path)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class ListenerManager(object):
+    '''Replacement for a listener manager that can notify its listeners'''
+
+    def __init__(self):
+        '''Stores the registered listeners'''
+        self.listeners = list()
+
+    def register_listener(self, callback):
+        '''Registers the callback'''
+        if not callback in self.listeners:
+            self.listeners.append(callback)
+
+    def unregister_listener(self, callback):
+        '''Unregisters the callback'''
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def notify(self, *args):
+        '''Calls all registered listeners with the given arguments'''
+        for callback in list(self.listeners):
+            callback(*args)
+
+
+class ConVar(object):
+    '''Replacement for a ConVar that stores its value as a string'''
+
+    def __init__(self, name, value='0', *args):
+        '''Stores the value'''
+        self.value = value
+
+    def get_int(self):
+        '''Returns the value as an integer'''
+        return int(self.value)
+
+    def set_int(self, value):
+        '''Sets the value'''
+        self.value = str(value)
+
+
+class EngineServer(object):
+    '''Replacement for the engine that ignores all output'''
+
+    def log_print(self, message):
+        '''Ignores the message'''
+
+    def server_command(self, command):
+        '''Ignores the command'''
+
+
+class GlobalVars(object):
+    '''Replacement for the global variables with a controllable clock'''
+
+    tick_count = 0
+    interval_per_tick = 1 / 66
+    max_clients = 64
+
+
+class GameEventManager(object):
+    '''Replacement for the game event manager that ignores listeners'''
+
+    @staticmethod
+    def add_listener(listener, event, server_side):
+        '''Ignores the listener'''
+
+    @staticmethod
+    def remove_listener(listener):
+        '''Ignores the listener'''
+
+
+class GameEventListener(object):
+    '''Replacement for the base game event listener class'''
+
+
+class GameEvent(object):
+    '''Replacement for a game event that stores its values'''
+
+    def __init__(self, **values):
+        '''Stores the event's values'''
+        self.values = values
+
+    def get_int(self, name):
+        '''Returns the given integer value'''
+        return self.values.get(name, 0)
+
+    def get_bool(self, name):
+        '''Returns the given bool value'''
+        return self.values.get(name, False)
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def install_module(name, **attributes):
+    '''Adds a module with the given attributes to sys.modules'''
+
+    # Create the module
+    module = sys.modules[name] = ModuleType(name)
+
+    # Set the module's attributes
+    for attribute, value in attributes.items():
+        setattr(module, attribute, value)
+
+    # Return the module
+    return module
+
+
+# Add the compiled modules needed by the core packages
+install_module('cvar_c', ConVar=ConVar)
+install_module('engine_c', EngineServer=EngineServer())
+install_module('globals_c', GlobalVars=GlobalVars)
+install_module(
+    'event_c', GameEventManager=GameEventManager,
+    GameEventListener=GameEventListener)
+install_module('listener_c', **dict(
+    (name + 'ListenerManager', ListenerManager()) for name in (
+        'ClientActive', 'ClientConnect', 'ClientDisconnect',
+        'ClientFullyConnect', 'ClientPutInServer', 'ClientSettingsChanged',
+        'LevelInit', 'LevelShutdown', 'NetworkidValidated',
+        'OnEdictAllocated', 'OnEdictFreed', 'OnQueryCvarValueFinished',
+        'ServerActivate', 'Tick')))
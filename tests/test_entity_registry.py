@@ -0,0 +1,74 @@
+# ../tests/test_entity_registry.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Unittest
+import unittest
+
+# Test Imports
+from tests import fakes
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Edict(object):
+    '''Replacement for an edict with a classname that can be set later'''
+
+    def __init__(self, index, classname=''):
+        '''Stores the index and classname'''
+        self.index = index
+        self.classname = classname
+
+    def get_class_name(self):
+        '''Returns the classname'''
+        return self.classname
+
+    def is_free(self):
+        '''Returns whether the edict is free'''
+        return False
+
+
+# Add the entity modules needed by entities.registry
+fakes.install_module('entity_c', EntityGenerator=lambda: iter([]))
+fakes.install_module(
+    'entities.helpers', index_from_edict=lambda edict: edict.index)
+fakes.install_module('entities.properties', EntityProperties=None)
+
+from listener_c import OnEdictAllocatedListenerManager
+from listener_c import TickListenerManager
+from entities.registry import EntityRegistry
+
+
+class EntityRegistryTests(unittest.TestCase):
+    '''Tests adding allocated edicts to the registry'''
+
+    def tearDown(self):
+        '''Removes all registered edicts'''
+        EntityRegistry.clear()
+        EntityRegistry._classnames.clear()
+        EntityRegistry._pending = list()
+
+    def test_lookup_during_allocation(self):
+        '''Tests looking up entities before the classname is set'''
+
+        # Look up the entities while the edict is being allocated
+        edict = Edict(70)
+        lookups = list()
+        listener = lambda edict: lookups.append(
+            EntityRegistry.get_edicts('weapon_ak47'))
+        OnEdictAllocatedListenerManager.register_listener(listener)
+        self.addCleanup(
+            OnEdictAllocatedListenerManager.unregister_listener, listener)
+        OnEdictAllocatedListenerManager.notify(edict)
+
+        # Was the edict not registered under an empty classname?
+        self.assertEqual(lookups, [[]])
+        self.assertNotIn('', EntityRegistry)
+
+        # Is the edict registered once its classname is set?
+        edict.classname = 'weapon_ak47'
+        TickListenerManager.notify()
+        self.assertEqual(EntityRegistry.get_edicts('weapon_ak47'), [edict])
@@ -0,0 +1,170 @@
+# ../tests/test_player_masks.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Unittest
+import unittest
+
+# Test Imports
+from tests import fakes
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the fake players by their index
+_players = dict()
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _PlayerInfo(object):
+    '''Replacement for a PlayerInfo instance'''
+
+    def __init__(self, index, team, dead=False, bot=False):
+        '''Stores the player's state'''
+        self.index = index
+        self.team = team
+        self.dead = dead
+        self.bot = bot
+
+    def is_fake_client(self):
+        '''Returns whether the player is a bot'''
+        return self.bot
+
+    def is_player(self):
+        '''Returns whether the player is a human'''
+        return not self.bot
+
+    def is_dead(self):
+        '''Returns whether the player is dead'''
+        return self.dead
+
+    def get_team_index(self):
+        '''Returns the player's team'''
+        return self.team
+
+
+def _return_none(player):
+    '''Returns None for return types that are not tested'''
+
+
+# Add the player modules used by filters.players
+fakes.install_module(
+    'player_c',
+    PlayerGenerator=lambda: iter([_players[x] for x in sorted(_players)]))
+fakes.install_module('players', __path__=[])
+fakes.install_module('players.entity', PlayerEntity=object)
+fakes.install_module(
+    'players.helpers',
+    index_from_edict=lambda edict: edict,
+    index_from_playerinfo=lambda player: player.index,
+    index_from_userid=lambda userid: userid,
+    playerinfo_from_index=lambda index: _players[index],
+    **dict((name, _return_none) for name in (
+        'address_from_playerinfo', 'basehandle_from_playerinfo',
+        'cl_language_from_index',
+        'edict_from_playerinfo', 'inthandle_from_playerinfo',
+        'pointer_from_playerinfo',
+        'uniqueid_from_playerinfo', 'userid_from_playerinfo')))
+
+# Use a game that has a teams file
+import core
+core.GAME_NAME = 'cstrike'
+
+from events.manager import EventRegistry
+from filters.iterator import _IterObject
+from filters.players import PlayerIter
+from filters.players import _PlayerMasksInstance
+
+
+class PlayerMasksTests(unittest.TestCase):
+    '''Tests the masks used by PlayerIter for built-in filters'''
+
+    def setUp(self):
+        '''Adds the players to the masks'''
+
+        # Add the players
+        _players.clear()
+        _players[1] = _PlayerInfo(1, 2)
+        _players[2] = _PlayerInfo(2, 3, bot=True)
+        _players[3] = _PlayerInfo(3, 2, dead=True)
+
+        # Add the players to the masks
+        _PlayerMasksInstance.clear()
+        for index in _players:
+            _PlayerMasksInstance.update_player(index)
+
+    def assert_matches_scan(self, *args):
+        '''Asserts that the masks give the same players as a scan'''
+
+        # Get the PlayerIter instance
+        iterator = PlayerIter(*args)
+
+        # Were the masks not used?
+        self.assertIsNotNone(iterator._is_keys)
+
+        # Get the players from the masks
+        result = list(iterator)
+
+        # Compare with the scan through all players
+        self.assertEqual(result, list(_IterObject.__iter__(iterator)))
+
+        # Return the players
+        return result
+
+    def test_filters(self):
+        '''Tests built-in filters against a scan'''
+        self.assertEqual(self.assert_matches_scan('alive'), [1, 2])
+        self.assertEqual(self.assert_matches_scan(['alive', 't']), [1])
+        self.assertEqual(self.assert_matches_scan([], 'bot'), [1, 3])
+
+    def test_player_death(self):
+        '''Tests that a killed player is dead before its state changes'''
+
+        # Fire player_death while the player's life state is still alive
+        EventRegistry['player_death'].fire_game_event(
+            fakes.GameEvent(userid=1))
+
+        # Is the player in the dead mask?
+        self.assertEqual(list(PlayerIter('dead')), [1, 3])
+        self.assertEqual(list(PlayerIter('alive')), [2])
+
+    def test_player_spawn(self):
+        '''Tests that a spawned player is alive'''
+
+        # Respawn the dead player
+        _players[3].dead = False
+        EventRegistry['player_spawn'].fire_game_event(
+            fakes.GameEvent(userid=3))
+
+        # Is the player in the alive mask?
+        self.assertEqual(self.assert_matches_scan('alive'), [1, 2, 3])
+
+    def test_player_team(self):
+        '''Tests that a player changing teams moves masks'''
+
+        # Move the player to the other team
+        EventRegistry['player_team'].fire_game_event(
+            fakes.GameEvent(userid=1, team=3))
+        _players[1].team = 3
+
+        # Is the player in the new team's mask?
+        self.assertEqual(self.assert_matches_scan('ct'), [1, 2])
+
+    def test_disconnect(self):
+        '''Tests that a disconnected player is removed'''
+
+        # Disconnect the player
+        fakes.sys.modules['listener_c'].ClientDisconnectListenerManager.notify(2)
+        del _players[2]
+
+        # Was the player removed?
+        self.assertEqual(self.assert_matches_scan('all'), [1, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+# ../tests/test_property_changes.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Unittest
+import unittest
+
+# Test Imports
+from tests import fakes
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Edict(object):
+    '''Replacement for an edict that stores its network properties'''
+
+    def __init__(self, index, classname, **values):
+        '''Stores the index, classname, and property values'''
+        self.index = index
+        self.classname = classname
+        self.values = values
+        self.serial_number = 0
+
+    def get_class_name(self):
+        '''Returns the classname'''
+        return self.classname
+
+    def is_free(self):
+        '''Returns whether the edict is free'''
+        return False
+
+    def get_change_info_serial_number(self):
+        '''Returns the change info serial number'''
+        return self.serial_number
+
+    def has_state_changed(self):
+        '''Returns whether the edict changed this frame'''
+        return False
+
+    def set_value(self, prop_name, value):
+        '''Sets the property's value and marks the edict as changed'''
+        self.values[prop_name] = value
+        self.serial_number += 1
+
+
+class PropHandle(object):
+    '''Replacement for a PropHandle that reads the edict's values'''
+
+    def __init__(self, prop_name):
+        '''Stores the property name'''
+        self.name = prop_name
+
+    def get_value(self, edict):
+        '''Returns the property's value or raises a ValueError'''
+        if not self.name in edict.values:
+            raise ValueError('Unable to find property "{0}".'.format(
+                self.name))
+        return edict.values[self.name]
+
+
+# Add the entity modules needed by entities.changes
+fakes.install_module(
+    'entity_c', EntityGenerator=lambda: iter([]), PropHandle=PropHandle)
+fakes.install_module(
+    'entities.helpers', index_from_edict=lambda edict: edict.index)
+fakes.install_module('entities.properties', EntityProperties=None)
+
+from listener_c import OnEdictAllocatedListenerManager
+from listener_c import TickListenerManager
+from entities.changes import PropertyChanges
+from entities.registry import EntityRegistry
+
+
+class PropertyChangesTests(unittest.TestCase):
+    '''Tests subscribing to and unsubscribing from property changes'''
+
+    def setUp(self):
+        '''Creates the watched entities'''
+
+        # Create the entities
+        self.first = Edict(1, 'player', m_iHealth=100, m_ArmorValue=0)
+        self.second = Edict(2, 'player', m_iHealth=100, m_ArmorValue=0)
+        EntityRegistry.add_edict(self.first)
+        EntityRegistry.add_edict(self.second)
+
+        # Store the calls of the callbacks
+        self.calls = list()
+
+        # Remove all subscriptions and entities after the test
+        self.addCleanup(self.remove_entities)
+        self.addCleanup(self.unsubscribe_all)
+
+    def remove_entities(self):
+        '''Removes all registered entities'''
+        EntityRegistry.clear()
+        EntityRegistry._classnames.clear()
+        EntityRegistry._pending = list()
+
+    def unsubscribe_all(self):
+        '''Removes all subscriptions'''
+        for classname, watched_class in list(PropertyChanges.items()):
+            for prop_name, callbacks in list(watched_class.items()):
+                for callback in list(callbacks):
+                    PropertyChanges.unsubscribe(classname, prop_name, callback)
+
+    def store_call(self, *args):
+        '''Stores the call'''
+        self.calls.append(args)
+
+    def unsubscribe_on_call(self, *args):
+        '''Stores the call and unsubscribes from all properties'''
+        self.calls.append(args)
+        self.unsubscribe_all()
+
+    def test_unsubscribe_in_callback(self):
+        '''Tests unsubscribing from a callback during the tick'''
+
+        # Subscribe to both properties
+        PropertyChanges.subscribe(
+            'player', 'm_iHealth', self.unsubscribe_on_call)
+        PropertyChanges.subscribe('player', 'm_ArmorValue', self.store_call)
+
+        # Change both properties of an entity
+        self.first.set_value('m_iHealth', 50)
+        self.first.set_value('m_ArmorValue', 100)
+        TickListenerManager.notify()
+
+        # Was only the first callback called?
+        self.assertEqual(self.calls, [(1, 'm_iHealth', 100, 50)])
+        self.assertFalse(PropertyChanges)
+
+    def test_subscribe_in_callback(self):
+        '''Tests subscribing from a callback during the tick'''
+
+        # Subscribe to a property and to another property when it changes
+        PropertyChanges.subscribe(
+            'player', 'm_iHealth', lambda *args: PropertyChanges.subscribe(
+                'player', 'm_ArmorValue', self.store_call))
+
+        # Change the property of both entities
+        self.first.set_value('m_iHealth', 50)
+        self.second.set_value('m_iHealth', 50)
+        TickListenerManager.notify()
+
+        # Is the other property watched?
+        self.assertIn('m_ArmorValue', PropertyChanges['player'])
+
+    def test_invalid_property(self):
+        '''Tests that an invalid property does not change any state'''
+
+        # Subscribe to an invalid property
+        with self.assertRaises(ValueError):
+            PropertyChanges.subscribe('player', 'm_iHelth', self.store_call)
+
+        # Was nothing stored?
+        self.assertFalse(PropertyChanges)
+        self.assertNotIn(PropertyChanges._tick, TickListenerManager.listeners)
+
+        # Subscribe to a valid property and to an invalid property
+        PropertyChanges.subscribe('player', 'm_iHealth', self.store_call)
+        with self.assertRaises(ValueError):
+            PropertyChanges.subscribe('player', 'm_iHelth', self.store_call)
+
+        # Do changes still call the callback?
+        self.first.set_value('m_iHealth', 50)
+        TickListenerManager.notify()
+        self.assertEqual(self.calls, [(1, 'm_iHealth', 100, 50)])
+
+    def test_invalid_property_without_entities(self):
+        '''Tests that an invalid property is removed once an entity of
+            the classname is created, without losing the other entities'''
+
+        # Subscribe to an invalid and a valid property of a classname
+        # that has no entities, so the properties can not be validated
+        PropertyChanges.subscribe('prop_physics', 'm_iHelth', self.store_call)
+        PropertyChanges.subscribe('prop_physics', 'm_iHealth', self.store_call)
+
+        # Create two entities of the classname
+        first = Edict(3, 'prop_physics', m_iHealth=10)
+        second = Edict(4, 'prop_physics', m_iHealth=10)
+        OnEdictAllocatedListenerManager.notify(first)
+        OnEdictAllocatedListenerManager.notify(second)
+        TickListenerManager.notify()
+
+        # Was the invalid property removed and were both entities added?
+        self.assertEqual(list(PropertyChanges['prop_physics']), ['m_iHealth'])
+        self.assertEqual(
+            sorted(PropertyChanges['prop_physics'].entities), [3, 4])
+
+        # Do changes call the callback?
+        second.set_value('m_iHealth', 5)
+        TickListenerManager.notify()
+        self.assertEqual(self.calls, [(4, 'm_iHealth', 10, 5)])
@@ -0,0 +1,104 @@
+# ../tests/test_repeat.py
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Unittest
+import unittest
+from unittest import mock
+
+# Test Imports
+from tests import fakes
+
+from listener_c import TickListenerManager
+from tick.repeat import Repeat
+from tick.repeat import RepeatStatus
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class RepeatPauseTests(unittest.TestCase):
+    '''Tests pausing and resuming a repeat from its own callback'''
+
+    def setUp(self):
+        '''Starts a controllable clock'''
+
+        # Start the clock
+        self.current_time = 1000.0
+        patcher = mock.patch('time.time', lambda: self.current_time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Store the times the callback was called
+        self.calls = list()
+
+    def run_until(self, seconds):
+        '''Moves the clock forward and runs the ticks'''
+        self.current_time += seconds
+        TickListenerManager.notify()
+
+    def pause_on_first_loop(self):
+        '''Stores the call and pauses the repeat on the first loop'''
+
+        # Store the call
+        self.calls.append(self.current_time)
+
+        # Is this the first loop?
+        if len(self.calls) == 1:
+
+            # Pause the repeat
+            self.repeat.pause()
+
+    def assert_resumes_after_interval(self, fixed):
+        '''Asserts that a repeat paused in its callback resumes after
+            a full interval, not on the next tick'''
+
+        # Start the repeat
+        self.repeat = Repeat(self.pause_on_first_loop)
+        self.repeat.start(1, 0, fixed)
+        self.addCleanup(self.repeat.stop)
+
+        # Call the first loop
+        self.run_until(1)
+        self.assertEqual(self.repeat.status, RepeatStatus.PAUSED)
+        self.assertAlmostEqual(self.repeat._loop_time, 1.0)
+
+        # Resume the repeat
+        self.repeat.resume()
+
+        # Is the next loop not called before the interval?
+        self.run_until(0.5)
+        self.assertEqual(len(self.calls), 1)
+
+        # Is the next loop called after the interval?
+        self.run_until(0.5)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_pause_resume(self):
+        '''Tests a repeat that uses a delay for each loop'''
+        self.assert_resumes_after_interval(False)
+
+    def test_pause_resume_fixed(self):
+        '''Tests a repeat on a fixed schedule'''
+        self.assert_resumes_after_interval(True)
+
+    def test_next_time_fixed(self):
+        '''Tests that next_time is the next loop's time in the callback'''
+
+        # Store the next_time read by the callback
+        next_times = list()
+        repeat = Repeat(lambda: next_times.append(repeat.next_time))
+        repeat.start(1, 0, True)
+        self.addCleanup(repeat.stop)
+
+        # Call the first loop
+        self.run_until(1)
+
+        # Was the second loop's time returned?
+        self.assertEqual(next_times, [self.current_time + 1])
+
+
+if __name__ == '__main__':
+    unittest.main()